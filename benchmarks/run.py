@@ -0,0 +1,372 @@
+"""Offline benchmarks of the refresh, parsing, entity update and memory use.
+
+Run from the repository root:
+
+    python -m benchmarks.run --companies 500 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+import gc
+import json
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from homeassistant import loader
+from homeassistant.setup import async_setup_component
+
+from custom_components.companies_house import api
+from custom_components.companies_house.api import CompaniesHouseApiClient
+from custom_components.companies_house.const import (
+    CONF_API_KEY,
+    CONF_COMPANY_NUMBER,
+    CONF_UPDATE_INTERVAL,
+    DATA_RATE_LIMITERS,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.companies_house.coordinator import async_get_coordinator
+from custom_components.companies_house.profile import extract_record, format_address
+from custom_components.companies_house.ratelimit import CompaniesHouseRateLimiter
+from custom_components.companies_house.sensor import (
+    SENSOR_TYPES,
+    CompaniesHouseSensor,
+)
+
+from .stub_server import CompaniesHouseStubServer, company_number, make_profile
+
+API_KEY = "benchmark"
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _timings(seconds: list[float]) -> dict[str, float]:
+    """Summarize repeated runs of the same work."""
+    return {
+        "best_s": min(seconds),
+        "median_s": statistics.median(seconds),
+        "runs": len(seconds),
+    }
+
+
+def _latencies(seconds: list[float]) -> dict[str, float]:
+    """Summarize the latency of individual requests, in milliseconds."""
+    cuts = statistics.quantiles(seconds, n=100) if len(seconds) > 1 else seconds * 99
+    return {
+        "latency_p50_ms": cuts[49] * 1000,
+        "latency_p95_ms": cuts[94] * 1000,
+        "latency_p99_ms": cuts[98] * 1000,
+        "latency_max_ms": max(seconds) * 1000,
+    }
+
+
+def _repeat(func: Callable[[], Any], repeat: int) -> list[float]:
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+@asynccontextmanager
+async def _environment(args: argparse.Namespace, cache_ttl: float = api.CACHE_TTL):
+    """Yield a fresh Home Assistant and stub server, with the API pointed at it."""
+    server = CompaniesHouseStubServer(latency=args.latency)
+    await server.start()
+    with (
+        tempfile.TemporaryDirectory() as config_dir,
+        patch.object(api, "API_BASE_URL", server.url),
+        patch.object(api, "CACHE_TTL", cache_ttl),
+    ):
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # load the integration from this checkout
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            # the real bucket would throttle large runs to 600 requests
+            hass.data.setdefault(DOMAIN, {}).setdefault(DATA_RATE_LIMITERS, {})[
+                API_KEY
+            ] = CompaniesHouseRateLimiter(capacity=10**9, window=1)
+            yield hass, server
+    await server.stop()
+
+
+async def bench_client(args: argparse.Namespace) -> dict[str, Any]:
+    """Throughput and latency of the API client under concurrency."""
+    numbers = [company_number(index) for index in range(args.companies)]
+    results: dict[str, Any] = {"concurrency": args.concurrency}
+    async with _environment(args) as (hass, server):
+        client = CompaniesHouseApiClient(hass, API_KEY)
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        # the second pass is served by the micro-cache, the third one
+        # revalidates the cached profiles with ETags
+        for phase, cache_ttl in (
+            ("cold", api.CACHE_TTL),
+            ("micro_cache", api.CACHE_TTL),
+            ("revalidate", 0),
+        ):
+            server.reset_counters()
+            latencies: list[float] = []
+
+            async def _fetch(number: str) -> None:
+                async with semaphore:
+                    start = time.perf_counter()
+                    await client.get_company_profile(number)
+                    latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            with patch.object(api, "CACHE_TTL", cache_ttl):
+                await asyncio.gather(*(_fetch(number) for number in numbers))
+            elapsed = time.perf_counter() - start
+            results[phase] = {
+                "requests": server.requests,
+                "not_modified": server.not_modified,
+                "bytes": server.bytes_sent,
+                "elapsed_s": elapsed,
+                "requests_per_s": server.requests / elapsed,
+                **_latencies(latencies),
+            }
+    return results
+
+
+async def bench_refresh(args: argparse.Namespace) -> dict[str, Any]:
+    """Cost of a hub refresh and of updating every entity afterwards."""
+    numbers = [company_number(index) for index in range(args.companies)]
+    results: dict[str, Any] = {}
+    # every refresh goes to the server, as it would hours apart
+    async with _environment(args, cache_ttl=0) as (hass, server):
+        coordinator = await async_get_coordinator(hass, API_KEY)
+        for number in numbers:
+            await coordinator.async_add_company(number, DEFAULT_UPDATE_INTERVAL)
+        sensors = [
+            CompaniesHouseSensor(coordinator, number, description)
+            for number in numbers
+            for description in SENSOR_TYPES
+        ]
+
+        async def _refresh(phase: str) -> None:
+            server.reset_counters()
+            # every company due at once, the worst case of a refresh
+            coordinator._next_poll = dict.fromkeys(numbers, 0.0)  # noqa: SLF001
+            start = time.perf_counter()
+            data = await coordinator._async_update_data()  # noqa: SLF001
+            elapsed = time.perf_counter() - start
+            coordinator.data = data
+            changed = coordinator._changed_companies  # noqa: SLF001
+            start = time.perf_counter()
+            updated = sum(sensor._update_value() for sensor in sensors)  # noqa: SLF001
+            entities_elapsed = time.perf_counter() - start
+            results[phase] = {
+                "requests": server.requests,
+                "not_modified": server.not_modified,
+                "bytes": server.bytes_sent,
+                "changed_companies": len(changed) if changed is not None else None,
+                "elapsed_s": elapsed,
+                "per_company_ms": elapsed / len(numbers) * 1000,
+                "entities": len(sensors),
+                "entities_updated": updated,
+                "entity_update_s": entities_elapsed,
+                "per_entity_us": entities_elapsed / len(sensors) * 1e6,
+            }
+
+        await _refresh("unchanged")
+        server.generation += 1
+        await _refresh("changed")
+    return results
+
+
+async def bench_parsing(args: argparse.Namespace) -> dict[str, Any]:
+    """Cost of turning the profiles of one refresh into entity values."""
+    profiles = [make_profile(company_number(index)) for index in range(args.companies)]
+    addresses = [profile["registered_office_address"] for profile in profiles]
+
+    def _extract() -> None:
+        for profile in profiles:
+            extract_record(profile)
+
+    def _format() -> None:
+        for address in addresses:
+            format_address(address)
+
+    results: dict[str, Any] = {}
+    for name, func in (("extract_record", _extract), ("format_address", _format)):
+        timings = _timings(_repeat(func, args.repeat))
+        timings["per_company_us"] = timings["best_s"] / len(profiles) * 1e6
+        results[name] = timings
+    return results
+
+
+def _retained(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by what a function returns."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()  # noqa: F841
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+async def bench_memory(args: argparse.Namespace) -> dict[str, Any]:
+    """Memory kept per company, as raw profiles, as records and by the hub."""
+    numbers = [company_number(index) for index in range(args.companies)]
+    bodies = [json.dumps(make_profile(number)).encode() for number in numbers]
+    results: dict[str, Any] = {}
+
+    for name, build in (
+        ("raw_profiles", lambda: [json.loads(body) for body in bodies]),
+        ("records", lambda: [extract_record(json.loads(body)) for body in bodies]),
+    ):
+        size = _retained(build)
+        results[name] = {"bytes": size, "per_company_bytes": size / len(numbers)}
+
+    # everything the hub keeps: records, response cache, store, aggregates...
+    async with _environment(args) as (hass, server):
+        coordinator = await async_get_coordinator(hass, API_KEY)
+        # the responses of the stub server are not part of the hub
+        for number in numbers:
+            server._body(number)  # noqa: SLF001
+        gc.collect()
+        tracemalloc.start()
+        try:
+            for number in numbers:
+                await coordinator.async_add_company(number, DEFAULT_UPDATE_INTERVAL)
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        results["hub"] = {"bytes": size, "per_company_bytes": size / len(numbers)}
+    return results
+
+
+async def bench_setup(args: argparse.Namespace) -> dict[str, Any]:
+    """End-to-end setup of one config entry per company."""
+    results: dict[str, Any] = {}
+    async with _environment(args) as (hass, server):
+        entries = [
+            MockConfigEntry(
+                domain=DOMAIN,
+                title=company_number(index),
+                unique_id=company_number(index),
+                data={
+                    CONF_API_KEY: API_KEY,
+                    CONF_COMPANY_NUMBER: company_number(index),
+                    CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+                },
+            )
+            for index in range(args.companies)
+        ]
+        for entry in entries:
+            entry.add_to_hass(hass)
+
+        async def _setup(phase: str, setup: Awaitable[Any]) -> None:
+            server.reset_counters()
+            start = time.perf_counter()
+            await setup
+            await hass.async_block_till_done()
+            elapsed = time.perf_counter() - start
+            results[phase] = {
+                "entries": len(entries),
+                "requests": server.requests,
+                "entities": len(hass.states.async_entity_ids()),
+                "elapsed_s": elapsed,
+                "per_entry_ms": elapsed / len(entries) * 1000,
+            }
+
+        # without stored profiles every entry fetches its company
+        await _setup("cold", async_setup_component(hass, DOMAIN, {}))
+        for entry in entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        # a restart sets the entries up from the stored profiles
+        await _setup(
+            "stored",
+            asyncio.gather(
+                *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+            ),
+        )
+    return results
+
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], Awaitable[dict[str, Any]]]] = {
+    "client": bench_client,
+    "refresh": bench_refresh,
+    "parsing": bench_parsing,
+    "setup": bench_setup,
+    "memory": bench_memory,
+}
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected benchmarks and return their results."""
+    report: dict[str, Any] = {
+        "meta": {
+            "timestamp": time.time(),
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "companies": args.companies,
+            "latency_s": args.latency,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+    for name in args.only or BENCHMARKS:
+        report["results"][name] = await BENCHMARKS[name](args)
+    return report
+
+
+def main() -> None:
+    """Parse the arguments and write the report as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--companies", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_REQUESTS)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to every response"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", action="append", choices=list(BENCHMARKS))
+    parser.add_argument("--output", type=Path, help="write here instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(async_main(args))
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        sys.stdout.write(text + "\n")
+    else:
+        args.output.write_text(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
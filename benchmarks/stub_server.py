@@ -0,0 +1,148 @@
+"""Local stand-in for the Companies House API."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+from typing import Any
+
+from aiohttp import web
+
+STATUSES = ("active", "active", "active", "dissolved", "liquidation")
+ACCOUNT_TYPES = ("micro-entity", "small", "dormant", "full", "total-exemption-full")
+
+
+def company_number(index: int) -> str:
+    """Return the company number of the index-th company."""
+    return f"{index:08d}"
+
+
+def make_profile(number: str, generation: int = 0) -> dict[str, Any]:
+    """Return a realistic, deterministic profile of a company."""
+    rng = random.Random(number)
+    year = rng.randint(1990, 2023)
+    month = rng.randint(1, 12)
+    due_year = 2026 + generation
+    return {
+        "company_number": number,
+        "company_name": f"BENCHMARK {number} LIMITED",
+        "company_status": rng.choice(STATUSES),
+        "type": "ltd",
+        "jurisdiction": "england-wales",
+        "date_of_creation": f"{year}-{month:02d}-{rng.randint(1, 28):02d}",
+        "registered_office_address": {
+            "premises": str(rng.randint(1, 200)),
+            "address_line_1": f"{rng.randint(1, 99)} High Street",
+            "locality": rng.choice(("London", "Cardiff", "Leeds", "Bristol")),
+            "postal_code": f"AB{rng.randint(1, 99)} {rng.randint(1, 9)}CD",
+            "country": "United Kingdom",
+        },
+        "sic_codes": [str(rng.randint(10000, 99999)) for _ in range(rng.randint(1, 4))],
+        "accounts": {
+            "accounting_reference_date": {"day": "31", "month": f"{month:02d}"},
+            "next_accounts": {
+                "period_start_on": f"{due_year - 2}-{month:02d}-01",
+                "period_end_on": f"{due_year - 1}-{month:02d}-28",
+                "due_on": f"{due_year}-{month:02d}-28",
+                "overdue": False,
+            },
+            "last_accounts": {
+                "made_up_to": f"{due_year - 2}-{month:02d}-28",
+                "period_end_on": f"{due_year - 2}-{month:02d}-28",
+                "type": rng.choice(ACCOUNT_TYPES),
+            },
+        },
+        "confirmation_statement": {
+            "next_due": f"{due_year}-{month:02d}-14",
+            "next_made_up_to": f"{due_year}-{month:02d}-01",
+            "last_made_up_to": f"{due_year - 1}-{month:02d}-01",
+            "overdue": False,
+        },
+        "has_insolvency_history": False,
+        "has_charges": rng.random() < 0.3,
+        "can_file": True,
+        "registered_office_is_in_dispute": False,
+        "undeliverable_registered_office_address": False,
+        "etag": f"{number}{generation}",
+        "links": {"self": f"/company/{number}"},
+    }
+
+
+class CompaniesHouseStubServer:
+    """Serves generated profiles with ETags and an optional response latency.
+
+    Raising `generation` changes every profile, as if all companies filed.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Create a server (call start before use)."""
+        self.latency = latency
+        self.generation = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._bodies: dict[tuple[str, int], tuple[bytes, str]] = {}
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def start(self) -> None:
+        """Listen on a free local port."""
+        app = web.Application()
+        app.router.add_get("/company/{number}", self._handle_profile)
+        app.router.add_get("/company/{number}/{resource}", self._handle_list)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Close the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def reset_counters(self) -> None:
+        """Zero the request counters."""
+        self.requests = self.not_modified = self.bytes_sent = 0
+
+    def _body(self, number: str) -> tuple[bytes, str]:
+        key = (number, self.generation)
+        if (cached := self._bodies.get(key)) is None:
+            body = json.dumps(make_profile(number, self.generation)).encode()
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            cached = self._bodies[key] = (body, etag)
+        return cached
+
+    async def _handle_profile(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        body, etag = self._body(request.match_info["number"])
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        self.bytes_sent += len(body)
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    async def _handle_list(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        number = request.match_info["number"]
+        items = [
+            {
+                "name": f"OFFICER {index} OF {number}",
+                "transaction_id": f"{number}-{index}",
+                "date": f"2025-01-{28 - index:02d}",
+                "status": "outstanding",
+            }
+            for index in range(5)
+        ]
+        body = json.dumps({"items": items, "total_results": len(items)}).encode()
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type="application/json")
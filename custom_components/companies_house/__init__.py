@@ -1,36 +1,154 @@
 """Init integration."""
 
+from functools import partial
+
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .api import CompaniesHouseApiClient
-from .const import CONF_API_KEY, CONF_COMPANY_NUMBER, CONF_UPDATE_INTERVAL
-from .coordinator import CompaniesHouseDataUpdateCoordinator
+from .const import (
+    CONF_API_KEY,
+    CONF_CACHE_TTL,
+    CONF_COMPANY_NUMBER,
+    CONF_ENTITY_GROUPS,
+    CONF_ERROR_RATE,
+    CONF_ERROR_STATUS,
+    CONF_LATENCY,
+    CONF_MODE,
+    CONF_PATH,
+    CONF_STREAM_KEY,
+    CONF_TRANSPORT,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+    ENTITY_GROUPS,
+)
+from .coordinator import async_get_coordinator, async_release_coordinator
+from .services import async_setup_services
+from .storage import async_get_filing_store, async_get_profile_store
+from .stream import async_get_stream_consumer, async_release_stream_consumer
+from .transport import MODE_RECORD, MODE_REPLAY, async_setup_transport
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+# companies are set up from the UI, YAML only records or replays API responses
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_TRANSPORT): vol.Schema(
+                    {
+                        vol.Required(CONF_MODE): vol.In([MODE_RECORD, MODE_REPLAY]),
+                        vol.Required(CONF_PATH): cv.string,
+                        vol.Optional(CONF_LATENCY, default=0.0): vol.All(
+                            vol.Coerce(float), vol.Range(min=0)
+                        ),
+                        vol.Optional(CONF_ERROR_RATE, default=0.0): vol.All(
+                            vol.Coerce(float), vol.Range(min=0, max=1)
+                        ),
+                        vol.Optional(CONF_ERROR_STATUS, default=503): vol.All(
+                            vol.Coerce(int), vol.Any(0, vol.Range(min=400, max=599))
+                        ),
+                    }
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration services and the configured transport."""
+    if CONF_TRANSPORT in (domain_config := config.get(DOMAIN, {})):
+        await async_setup_transport(hass, domain_config[CONF_TRANSPORT])
+    async_setup_services(hass)
+    return True
+
+
+def _update_interval(entry: ConfigEntry) -> int:
+    """Return the update interval of an entry, set at creation or since."""
+    return entry.options.get(CONF_UPDATE_INTERVAL, entry.data[CONF_UPDATE_INTERVAL])
+
+
+def _entity_groups(entry: ConfigEntry) -> set[str]:
+    """Return the entity groups created for an entry, all of them by default."""
+    return set(entry.options.get(CONF_ENTITY_GROUPS, ENTITY_GROUPS))
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up integration from a config entry."""
-    api_client = CompaniesHouseApiClient(hass, entry.data[CONF_API_KEY])
-
-    coordinator = CompaniesHouseDataUpdateCoordinator(
-        hass,
-        api_client=api_client,
-        company_number=entry.data[CONF_COMPANY_NUMBER],
-        update_interval_minutes=entry.data[CONF_UPDATE_INTERVAL],
+    api_key = entry.data[CONF_API_KEY]
+    company_number = entry.data[CONF_COMPANY_NUMBER]
+    coordinator = await async_get_coordinator(hass, api_key)
+    coordinator.api_client.set_cache_ttl(
+        company_number, entry.options.get(CONF_CACHE_TTL)
     )
 
-    # initial refresh must succeed for setup to continue
-    await coordinator.async_config_entry_first_refresh()
+    # without a stored snapshot the initial fetch must succeed to continue
+    try:
+        await coordinator.async_add_company(company_number, _update_interval(entry))
+    except Exception:
+        await async_release_coordinator(hass, api_key)
+        raise
 
     entry.runtime_data = coordinator
 
+    if stream_key := entry.data.get(CONF_STREAM_KEY):
+        consumer = await async_get_stream_consumer(hass, stream_key)
+        consumer.async_track(company_number, coordinator)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(
+        entry.add_update_listener(
+            partial(async_update_options, entity_groups=_entity_groups(entry))
+        )
+    )
     return True
 
 
+async def async_update_options(
+    hass: HomeAssistant, entry: ConfigEntry, entity_groups: set[str]
+) -> None:
+    """Apply new options to a running company.
+
+    The interval and cache settings are handed to the coordinator and client,
+    only a change of entity groups reloads the entry to recreate entities.
+    """
+    if _entity_groups(entry) != entity_groups:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator = entry.runtime_data
+    company_number = entry.data[CONF_COMPANY_NUMBER]
+    coordinator.async_set_update_interval(company_number, _update_interval(entry))
+    coordinator.api_client.set_cache_ttl(
+        company_number, entry.options.get(CONF_CACHE_TTL)
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        company_number = entry.data[CONF_COMPANY_NUMBER]
+        if stream_key := entry.data.get(CONF_STREAM_KEY):
+            consumer = await async_get_stream_consumer(hass, stream_key)
+            consumer.async_untrack(company_number)
+            await async_release_stream_consumer(hass, stream_key)
+        coordinator = entry.runtime_data
+        await coordinator.async_remove_company(company_number)
+        coordinator.async_release_hub_entities(entry.entry_id)
+        await async_release_coordinator(hass, entry.data[CONF_API_KEY])
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored profile and filings of a removed company."""
+    for store in (
+        await async_get_profile_store(hass),
+        await async_get_filing_store(hass),
+    ):
+        store.async_remove(entry.data[CONF_COMPANY_NUMBER])
@@ -1,60 +1,379 @@
 """API client to Companies House API."""
 
 import asyncio
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+import hashlib
+import random
+import time
+from typing import Any
 
 import aiohttp
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
-from .const import _LOGGER, API_BASE_URL
+from .circuit_breaker import CompaniesHouseCircuitBreaker, async_get_circuit_breaker
+from .const import (
+    _LOGGER,
+    API_BASE_URL,
+    DATA_API_CLIENTS,
+    DOMAIN,
+    MAX_RETRIES,
+    MAX_RETRY_DELAY,
+    RETRY_BASE_DELAY,
+)
+from .exceptions import (
+    CompaniesHouseAuthError,
+    CompaniesHouseBadRequestError,
+    CompaniesHouseConnectionError,
+    CompaniesHouseError,
+    CompaniesHouseNotFoundError,
+    CompaniesHouseRateLimitError,
+    CompaniesHouseServerError,
+)
+from .metrics import CompaniesHouseMetrics, async_get_metrics
+from .profile import CompanyRecord, extract_record
+from .ratelimit import CompaniesHouseRateLimiter, async_get_rate_limiter
+from .transport import async_get_transport
+
+# the largest page the list endpoints accept
+PAGE_SIZE = 100
+
+
+# bursts of calls for a company within this many seconds share one response
+CACHE_TTL = 10
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Parsed response body with the validators needed to revalidate it."""
+
+    data: CompanyRecord
+    etag: str | None
+    last_modified: str | None
+    # monotonic time of the response, or of its last revalidation, -inf for
+    # a profile restored from storage
+    fetched_at: float
+
+
+def _retry_after(headers: Mapping[str, str]) -> float | None:
+    value = headers.get("Retry-After")
+    if value and value.isdigit():
+        return float(value)
+    return None
 
 
 class CompaniesHouseApiClient:
     """API Client."""
 
     def __init__(self, hass: HomeAssistant, api_key: str) -> None:
-        """Initialize API Client (create session, store api key)."""
+        """Initialize API Client (get transport, store api key)."""
+        self._hass = hass
         self._api_key = api_key.strip()
-        self._session = async_get_clientsession(hass)
+        self._transport = async_get_transport(hass, API_BASE_URL)
+        self._rate_limiter = async_get_rate_limiter(hass, self._api_key)
+        self._circuit_breaker = async_get_circuit_breaker(hass, self._api_key)
+        self._metrics = async_get_metrics(hass, self._api_key)
+        # company number -> last profile, revalidated with conditional requests
+        self._profile_cache: dict[str, _CachedResponse] = {}
+        # company number -> profile request shared by concurrent callers
+        self._in_flight: dict[str, asyncio.Task[CompanyRecord]] = {}
+        # company number -> seconds a profile is reused, if not CACHE_TTL
+        self._cache_ttl: dict[str, float] = {}
+
+    @property
+    def rate_limiter(self) -> CompaniesHouseRateLimiter:
+        """Return the rate limiter shared with other clients of this key."""
+        return self._rate_limiter
 
-    def _raise_error(self, error_code: str) -> None:
-        """Raise a ValueError (helper to avoid TRY301)."""
-        raise ValueError(error_code)
+    @property
+    def circuit_breaker(self) -> CompaniesHouseCircuitBreaker:
+        """Return the circuit breaker shared with other clients of this key."""
+        return self._circuit_breaker
 
-    async def get_company_profile(self, company_number: str) -> dict:
-        """Get company profile JSON."""
+    @property
+    def metrics(self) -> CompaniesHouseMetrics:
+        """Return the metrics shared with other clients of this key."""
+        return self._metrics
+
+    @property
+    def key_id(self) -> str:
+        """Return an identifier of the API key that does not reveal it."""
+        return hashlib.sha256(self._api_key.encode()).hexdigest()[:16]
+
+    def forget_company(self, company_number: str) -> None:
+        """Drop the cached profile of a company that is no longer tracked."""
         company_number = company_number.strip().upper()
-        url = f"{API_BASE_URL}/company/{company_number}"
-        auth = aiohttp.BasicAuth(self._api_key, "")
+        self._profile_cache.pop(company_number, None)
+        self._cache_ttl.pop(company_number, None)
+        self._metrics.forget_company(company_number)
 
+    def profile_validators(self, company_number: str) -> tuple[str | None, str | None]:
+        """Return the ETag and Last-Modified of the cached profile of a company."""
+        company_number = company_number.strip().upper()
+        if (cached := self._profile_cache.get(company_number)) is None:
+            return None, None
+        return cached.etag, cached.last_modified
+
+    def restore_profile(
+        self,
+        company_number: str,
+        record: CompanyRecord,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Cache a stored profile, so that its next fetch can be a 304."""
+        company_number = company_number.strip().upper()
+        if etag is None and last_modified is None:
+            return
+        self._profile_cache.setdefault(
+            company_number,
+            _CachedResponse(record, etag, last_modified, float("-inf")),
+        )
+
+    def set_cache_ttl(self, company_number: str, seconds: float | None) -> None:
+        """Set how long a profile of a company is reused, None for the default."""
+        company_number = company_number.strip().upper()
+        if seconds is None:
+            self._cache_ttl.pop(company_number, None)
+        else:
+            self._cache_ttl[company_number] = seconds
+
+    async def _async_get(
+        self,
+        path: str,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> tuple[int, Mapping[str, str], Any]:
+        """GET a resource, retrying transient failures.
+
+        Returns the status, headers and decoded body (None for 304).
+        """
+        attempt = 0
+        while True:
+            self._circuit_breaker.check()
+            try:
+                result = await self._async_get_once(path, params, headers)
+            except CompaniesHouseError as err:
+                self._metrics.record_error(err.code)
+                if err.outage:
+                    self._circuit_breaker.record_failure()
+                else:
+                    self._circuit_breaker.record_success()
+                if not err.retryable or attempt >= MAX_RETRIES:
+                    raise
+                # full jitter keeps clients of a recovering API from syncing up
+                delay = err.retry_after
+                if delay is None:
+                    delay = random.uniform(0, RETRY_BASE_DELAY * 2**attempt)
+                if delay > MAX_RETRY_DELAY:
+                    raise
+                attempt += 1
+                self._metrics.record_retry()
+                _LOGGER.debug(
+                    "Retrying %s in %.1fs (attempt %d): %s", path, delay, attempt, err
+                )
+                await asyncio.sleep(delay)
+                continue
+            self._circuit_breaker.record_success()
+            return result
+
+    async def _async_get_once(
+        self,
+        path: str,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[int, Mapping[str, str], Any]:
+        await self._rate_limiter.acquire()
+
+        start = time.monotonic()
         try:
             async with asyncio.timeout(10.0):
-                response = await self._session.get(url, auth=auth)
+                response = await self._transport.async_get(
+                    path, params, headers, self._api_key
+                )
+                self._rate_limiter.update_from_headers(response.headers)
+                body = response.body
+                self._metrics.record_response(
+                    response.status, time.monotonic() - start, len(body)
+                )
+
+                if response.status == 429:
+                    _LOGGER.warning("Companies House API: Rate limit exceeded")
+                    retry_after = _retry_after(response.headers)
+                    self._rate_limiter.penalize(retry_after)
+                    raise CompaniesHouseRateLimitError(retry_after)
 
                 if response.status == 401:
                     _LOGGER.error("Companies House API: Unauthorized (Check API Key)")
-                    self._raise_error("invalid_auth")
+                    raise CompaniesHouseAuthError
 
                 if response.status == 404:
-                    _LOGGER.error(
-                        "Companies House API: Company %s not found", company_number
-                    )
-                    self._raise_error("company_not_found")
+                    _LOGGER.error("Companies House API: %s not found", path)
+                    raise CompaniesHouseNotFoundError
 
                 if response.status == 400:
                     _LOGGER.error("Companies House API: Bad Request")
-                    self._raise_error("bad_request")
+                    raise CompaniesHouseBadRequestError
+
+                if response.status >= 500:
+                    _LOGGER.debug("Companies House API: HTTP %s", response.status)
+                    raise CompaniesHouseServerError(_retry_after(response.headers))
+
+                if response.status == 304:
+                    return response.status, response.headers, None
 
-                response.raise_for_status()
-                return await response.json()
+                if response.status >= 400:
+                    _LOGGER.error("HTTP error fetching %s: %s", path, response.status)
+                    raise CompaniesHouseError
 
-        except aiohttp.ClientResponseError as err:
-            _LOGGER.error("HTTP error fetching company profile: %s", err.status)
-            raise ValueError("api_error") from err
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Network error fetching data: %s", err)
-            raise ValueError("connection_error") from err
+                return response.status, response.headers, json_loads(body)
+
+        except CompaniesHouseError:
+            raise
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Network error fetching %s: %s", path, err)
+            raise CompaniesHouseConnectionError from err
         except Exception as err:
             _LOGGER.error("Unexpected error: %s", err)
-            raise ValueError("unknown_error") from err
+            raise CompaniesHouseError from err
+
+    async def get_company_profile(self, company_number: str) -> CompanyRecord:
+        """Get the company profile, parsed into a record.
+
+        The JSON is dropped once parsed. An unchanged profile (304 Not
+        Modified, or fetched within the last seconds) returns the cached
+        record itself, so callers can detect it with an identity check.
+        Concurrent calls for a company share one request.
+        """
+        company_number = company_number.strip().upper()
+
+        cached = self._profile_cache.get(company_number)
+        ttl = self._cache_ttl.get(company_number, CACHE_TTL)
+        if cached is not None and time.monotonic() - cached.fetched_at < ttl:
+            self._metrics.record_micro_cache_hit()
+            return cached.data
+
+        if (task := self._in_flight.get(company_number)) is None:
+            task = self._in_flight[company_number] = (
+                self._hass.async_create_background_task(
+                    self._async_fetch_profile(company_number),
+                    f"{DOMAIN} profile {company_number}",
+                )
+            )
+            task.add_done_callback(lambda _: self._in_flight.pop(company_number, None))
+        else:
+            self._metrics.record_coalesced()
+        # a cancelled caller must not cancel the request the others wait for
+        return await asyncio.shield(task)
+
+    async def _async_fetch_profile(self, company_number: str) -> CompanyRecord:
+        headers: dict[str, str] = {}
+        if (cached := self._profile_cache.get(company_number)) is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        start = time.monotonic()
+        status, response_headers, data = await self._async_get(
+            f"/company/{company_number}", headers=headers
+        )
+        self._metrics.record_profile_fetch(
+            company_number,
+            time.monotonic() - start,
+            conditional=bool(headers),
+            not_modified=status == 304,
+        )
+        if status == 304 and cached is not None:
+            cached.fetched_at = time.monotonic()
+            return cached.data
+
+        record = extract_record(data)
+        self._profile_cache[company_number] = _CachedResponse(
+            record,
+            response_headers.get("ETag"),
+            response_headers.get("Last-Modified"),
+            time.monotonic(),
+        )
+        return record
+
+    async def search_companies(self, query: str, items_per_page: int) -> dict:
+        """Search companies by name or number."""
+        _, _, data = await self._async_get(
+            "/search/companies",
+            params={"q": query, "items_per_page": str(items_per_page)},
+        )
+        return data
+
+    async def _async_paginate(
+        self, path: str, page_size: int = PAGE_SIZE
+    ) -> AsyncIterator[dict]:
+        """Yield the items of a list resource, one page at a time.
+
+        Pages are requested as the items are consumed, so a caller that stops
+        early saves the remaining requests.
+        """
+        start_index = 0
+        while True:
+            try:
+                _, _, page = await self._async_get(
+                    path,
+                    params={
+                        "items_per_page": str(page_size),
+                        "start_index": str(start_index),
+                    },
+                )
+            except CompaniesHouseNotFoundError:
+                # companies that never had any of these answer 404
+                return
+            items = page.get("items") or []
+            for item in items:
+                yield item
+            start_index += len(items)
+            total = page.get("total_results", page.get("total_count"))
+            if total is None:
+                # without a total only a short page tells it was the last one
+                total = start_index + (len(items) == page_size)
+            if not items or start_index >= total:
+                return
+
+    def iter_officers(self, company_number: str) -> AsyncIterator[dict]:
+        """Iterate over the officers of a company, resigned ones included."""
+        company_number = company_number.strip().upper()
+        return self._async_paginate(f"/company/{company_number}/officers")
+
+    def iter_persons_with_significant_control(
+        self, company_number: str
+    ) -> AsyncIterator[dict]:
+        """Iterate over the persons with significant control, ceased included."""
+        company_number = company_number.strip().upper()
+        return self._async_paginate(
+            f"/company/{company_number}/persons-with-significant-control"
+        )
+
+    def iter_charges(self, company_number: str) -> AsyncIterator[dict]:
+        """Iterate over the charges of a company, satisfied ones included."""
+        company_number = company_number.strip().upper()
+        return self._async_paginate(f"/company/{company_number}/charges")
+
+    def iter_filing_history(
+        self, company_number: str, page_size: int = PAGE_SIZE
+    ) -> AsyncIterator[dict]:
+        """Iterate over the filing history of a company, newest first."""
+        company_number = company_number.strip().upper()
+        return self._async_paginate(
+            f"/company/{company_number}/filing-history", page_size
+        )
+
+
+def async_get_api_client(hass: HomeAssistant, api_key: str) -> CompaniesHouseApiClient:
+    """Return the client shared by the flows and coordinators of an API key."""
+    clients: dict[str, CompaniesHouseApiClient] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_API_CLIENTS, {})
+    api_key = api_key.strip()
+    if (client := clients.get(api_key)) is None:
+        client = clients[api_key] = CompaniesHouseApiClient(hass, api_key)
+    return client
@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -12,28 +10,26 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import CONF_COMPANY_NUMBER, ENTITY_GROUP_DEADLINES, ENTITY_GROUP_STATUS
 from .coordinator import CompaniesHouseDataUpdateCoordinator
-from .entity import CompaniesHouseEntity
-
-
-def safe_get(data: dict, *keys: str) -> Any | None:
-    """Safely get nested dictionary values."""
-    current = data
-    for key in keys:
-        if not isinstance(current, dict):
-            return None
-        current = current.get(key)
-    return current
+from .entity import (
+    CompaniesHouseEntity,
+    CompaniesHouseEntityDescription,
+    async_company_descriptions,
+)
 
 
 @dataclass(frozen=True, kw_only=True)
-class CompaniesHouseBinarySensorEntityDescription(BinarySensorEntityDescription):
+class CompaniesHouseBinarySensorEntityDescription(
+    BinarySensorEntityDescription, CompaniesHouseEntityDescription
+):
     """Sensor entity description class."""
 
-    value_fn: Callable[[dict[str, Any]], bool | None]
+    field: str
 
 
 BINARY_SENSOR_TYPES: tuple[CompaniesHouseBinarySensorEntityDescription, ...] = (
@@ -41,36 +37,42 @@ BINARY_SENSOR_TYPES: tuple[CompaniesHouseBinarySensorEntityDescription, ...] = (
         key="accounts_overdue",
         translation_key="accounts_overdue",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        value_fn=lambda data: safe_get(data, "accounts", "next_accounts", "overdue"),
+        field="accounts_overdue",
+        group=ENTITY_GROUP_DEADLINES,
     ),
     CompaniesHouseBinarySensorEntityDescription(
         key="confirmation_statement_overdue",
         translation_key="confirmation_statement_overdue",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        value_fn=lambda data: safe_get(data, "confirmation_statement", "overdue"),
+        field="confirmation_statement_overdue",
+        group=ENTITY_GROUP_DEADLINES,
     ),
     CompaniesHouseBinarySensorEntityDescription(
         key="has_insolvency_history",
         translation_key="has_insolvency_history",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        value_fn=lambda data: data.get("has_insolvency_history"),
+        field="has_insolvency_history",
+        group=ENTITY_GROUP_STATUS,
     ),
     CompaniesHouseBinarySensorEntityDescription(
         key="can_file",
         translation_key="can_file",
-        value_fn=lambda data: data.get("can_file"),
+        field="can_file",
+        group=ENTITY_GROUP_STATUS,
     ),
     CompaniesHouseBinarySensorEntityDescription(
         key="registered_office_is_in_dispute",
         translation_key="registered_office_is_in_dispute",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        value_fn=lambda data: data.get("registered_office_is_in_dispute"),
+        field="registered_office_is_in_dispute",
+        group=ENTITY_GROUP_STATUS,
     ),
     CompaniesHouseBinarySensorEntityDescription(
         key="undeliverable_registered_office_address",
         translation_key="undeliverable_registered_office_address",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        value_fn=lambda data: data.get("undeliverable_registered_office_address"),
+        field="undeliverable_registered_office_address",
+        group=ENTITY_GROUP_STATUS,
     ),
 )
 
@@ -82,9 +84,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensors from a config entry."""
     coordinator = entry.runtime_data
+    company_number = entry.data[CONF_COMPANY_NUMBER]
     async_add_entities(
-        CompaniesHouseBinarySensor(coordinator, description)
-        for description in BINARY_SENSOR_TYPES
+        CompaniesHouseBinarySensor(coordinator, company_number, description)
+        for description in async_company_descriptions(
+            hass, entry, Platform.BINARY_SENSOR, BINARY_SENSOR_TYPES
+        )
     )
 
 
@@ -96,13 +101,18 @@ class CompaniesHouseBinarySensor(CompaniesHouseEntity, BinarySensorEntity):
     def __init__(
         self,
         coordinator: CompaniesHouseDataUpdateCoordinator,
+        company_number: str,
         description: CompaniesHouseBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, company_number, description.key)
         self.entity_description = description
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        self._update_value()
+
+    def _update_value(self) -> bool:
+        """Recompute the binary sensor value, return if it changed."""
+        value = getattr(self.company_record, self.entity_description.field)
+        if value == self._attr_is_on:
+            return False
+        self._attr_is_on = value
+        return True
@@ -0,0 +1,164 @@
+"""Bulk onboarding of companies."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import re
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from .api import async_get_api_client
+from .const import (
+    CONF_API_KEY,
+    CONF_COMPANY_NAME,
+    CONF_COMPANY_NUMBER,
+    CONF_STREAM_KEY,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+)
+from .exceptions import (
+    CompaniesHouseAuthError,
+    CompaniesHouseBadRequestError,
+    CompaniesHouseError,
+    CompaniesHouseNotFoundError,
+)
+from .profile import CompanyRecord
+from .storage import async_get_profile_store
+
+# two letters (SC, NI, OC...) or R0 and six digits, or six to eight digits
+# whose leading zeros a spreadsheet may have dropped
+_COMPANY_NUMBER_RE = re.compile(r"^(?:[A-Z]{2}\d{6}|R0\d{6}|\d{6,8})$")
+# header of the column holding the numbers, lower case without separators
+_NUMBER_HEADERS = {"companynumber", "number"}
+
+RESULT_ADDED = "added"
+RESULT_ALREADY_CONFIGURED = "already_configured"
+
+
+def _header_key(cell: str) -> str:
+    return re.sub(r"[\s_\-.]", "", cell).casefold()
+
+
+def parse_company_numbers(text: str) -> list[str]:
+    """Return the unique company numbers found in a list or CSV.
+
+    A CSV with a CompanyNumber (or Number) header is only read in that
+    column. Otherwise every cell that looks like a company number is used,
+    so other columns (names, addresses) are skipped. Numbers that lost their
+    leading zeros in a spreadsheet are padded back to eight digits.
+    """
+    rows = list(csv.reader(text.splitlines()))
+    column = next(
+        (
+            index
+            for index, cell in enumerate(rows[0] if rows else ())
+            if _header_key(cell) in _NUMBER_HEADERS
+        ),
+        None,
+    )
+    if column is None:
+        tokens = (token for row in rows for cell in row for token in cell.split())
+    else:
+        tokens = (row[column] for row in rows[1:] if len(row) > column)
+
+    numbers: dict[str, None] = {}
+    for token in tokens:
+        token = token.strip().upper()
+        if _COMPANY_NUMBER_RE.match(token):
+            numbers[token.zfill(8)] = None
+    return list(numbers)
+
+
+def error_code(err: CompaniesHouseError) -> str:
+    """Map an API client error to a config flow error code."""
+    if isinstance(
+        err,
+        (
+            CompaniesHouseAuthError,
+            CompaniesHouseBadRequestError,
+            CompaniesHouseNotFoundError,
+        ),
+    ):
+        return err.code
+    return "cannot_connect"
+
+
+async def async_import_companies(
+    hass: HomeAssistant,
+    api_key: str,
+    company_numbers: list[str],
+    update_interval: int,
+    stream_key: str | None = None,
+) -> dict[str, str]:
+    """Validate companies and create a config entry for each valid one.
+
+    Returns the result of every company number: "added", "already_configured"
+    or the error code of its validation.
+    """
+    configured = {
+        entry.unique_id for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    results: dict[str, str] = {
+        number: RESULT_ALREADY_CONFIGURED
+        for number in company_numbers
+        if number in configured
+    }
+
+    client = async_get_api_client(hass, api_key)
+    store = await async_get_profile_store(hass)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    auth_failed = asyncio.Event()
+
+    async def _validate(company_number: str) -> CompanyRecord | None:
+        async with semaphore:
+            # a rejected key fails every request, stop spending quota on it
+            if auth_failed.is_set():
+                results[company_number] = "invalid_auth"
+                return None
+            try:
+                profile = await client.get_company_profile(company_number)
+            except CompaniesHouseError as err:
+                results[company_number] = error_code(err)
+                if results[company_number] == "invalid_auth":
+                    auth_failed.set()
+                return None
+        # the new entry is set up from the store, without fetching it again
+        store.async_set(
+            company_number, profile, *client.profile_validators(company_number)
+        )
+        return profile
+
+    pending = [number for number in company_numbers if number not in results]
+    profiles = await asyncio.gather(*(_validate(number) for number in pending))
+
+    async def _create(company_number: str, profile: CompanyRecord) -> None:
+        data = {
+            CONF_API_KEY: api_key,
+            CONF_COMPANY_NUMBER: company_number,
+            CONF_COMPANY_NAME: profile.company_name or company_number,
+            CONF_UPDATE_INTERVAL: update_interval,
+        }
+        if stream_key:
+            data[CONF_STREAM_KEY] = stream_key
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": SOURCE_IMPORT}, data=data
+        )
+        results[company_number] = (
+            RESULT_ADDED
+            if result["type"] is FlowResultType.CREATE_ENTRY
+            else result["reason"]
+        )
+
+    await asyncio.gather(
+        *(
+            _create(number, profile)
+            for number, profile in zip(pending, profiles, strict=True)
+            if profile is not None
+        )
+    )
+
+    return {number: results[number] for number in company_numbers}
@@ -0,0 +1,104 @@
+"""Circuit breaker pausing requests while the API is down."""
+
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    _LOGGER,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_OPEN_TIME,
+    CIRCUIT_MIN_OPEN_TIME,
+    DATA_CIRCUIT_BREAKERS,
+    DOMAIN,
+)
+from .exceptions import CompaniesHouseCircuitOpenError
+
+# longer than a request with all of its retries
+PROBE_TIMEOUT = 120
+
+
+class CompaniesHouseCircuitBreaker:
+    """Circuit breaker shared by every client using the same API key.
+
+    After a run of consecutive failures the circuit opens and requests fail
+    immediately. Once the open time is over a single probe request is let
+    through: success closes the circuit, failure opens it again for twice as
+    long.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        min_open_time: float = CIRCUIT_MIN_OPEN_TIME,
+        max_open_time: float = CIRCUIT_MAX_OPEN_TIME,
+    ) -> None:
+        """Create a closed circuit."""
+        self._failure_threshold = failure_threshold
+        self._min_open_time = min_open_time
+        self._max_open_time = max_open_time
+        self._failures = 0
+        self._open_time = min_open_time
+        self._open_until: float | None = None
+        self._probing = False
+
+    @property
+    def closed(self) -> bool:
+        """Return if requests flow normally."""
+        return self._open_until is None
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe may be sent."""
+        if self._open_until is None:
+            return 0.0
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    def check(self) -> None:
+        """Raise if a request may not be sent now."""
+        if self._open_until is None:
+            return
+        now = time.monotonic()
+        if now < self._open_until:
+            raise CompaniesHouseCircuitOpenError(self.retry_in)
+        # half open: this request is the probe, hold the others back until it
+        # completes (or long enough to be sure it never will)
+        self._probing = True
+        self._open_until = now + PROBE_TIMEOUT
+
+    def record_success(self) -> None:
+        """Close the circuit after the API answered."""
+        if self._open_until is not None:
+            _LOGGER.info("Companies House API is available again")
+        self._failures = 0
+        self._open_time = self._min_open_time
+        self._open_until = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit when there are too many."""
+        self._failures += 1
+        if self._probing:
+            self._probing = False
+            self._open_time = min(self._open_time * 2, self._max_open_time)
+        elif self._open_until is not None or self._failures < self._failure_threshold:
+            return
+        _LOGGER.warning(
+            "Companies House API unavailable, pausing requests for %ds",
+            self._open_time,
+        )
+        self._open_until = time.monotonic() + self._open_time
+
+
+def async_get_circuit_breaker(
+    hass: HomeAssistant, api_key: str
+) -> CompaniesHouseCircuitBreaker:
+    """Return the circuit breaker shared by all clients of an API key."""
+    breakers: dict[str, CompaniesHouseCircuitBreaker] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_CIRCUIT_BREAKERS, {})
+    if (breaker := breakers.get(api_key)) is None:
+        breaker = breakers[api_key] = CompaniesHouseCircuitBreaker()
+    return breaker
@@ -7,16 +7,41 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
+)
 
-from .api import CompaniesHouseApiClient
+from .api import CACHE_TTL, async_get_api_client
+from .bulk import (
+    RESULT_ADDED,
+    async_import_companies,
+    error_code,
+    parse_company_numbers,
+)
 from .const import (
     CONF_API_KEY,
+    CONF_CACHE_TTL,
+    CONF_COMPANY_NAME,
     CONF_COMPANY_NUMBER,
+    CONF_COMPANY_NUMBERS,
+    CONF_ENTITY_GROUPS,
+    CONF_QUERY,
+    CONF_STREAM_KEY,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    ENTITY_GROUPS,
 )
+from .exceptions import CompaniesHouseError
+from .search import SearchResult, async_get_search_cache
+from .storage import async_get_profile_store
 
 
 class CompaniesHouseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -24,53 +49,291 @@ class CompaniesHouseConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    _search_api_key: str
+    _search_results: tuple[SearchResult, ...] = ()
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> CompaniesHouseOptionsFlow:
+        """Return the options flow of a company."""
+        return CompaniesHouseOptionsFlow()
+
+    def _existing_api_key(self) -> str | None:
+        """Return the API key of a configured company."""
+        for entry in self._async_current_entries(include_ignore=False):
+            if api_key := entry.data.get(CONF_API_KEY):
+                return api_key
+        return None
+
+    def _keys_schema(self) -> dict[vol.Marker, Any]:
+        # once a company is configured its key is used when left empty, so the
+        # secret never has to be sent back to the frontend
+        if self._existing_api_key() is None:
+            return {vol.Required(CONF_API_KEY): str}
+        return {vol.Optional(CONF_API_KEY): str}
+
+    def _api_key(self, user_input: dict[str, Any]) -> str:
+        """Return the API key entered, else the key of a configured company."""
+        api_key = user_input.get(CONF_API_KEY, "").strip()
+        return api_key or self._existing_api_key() or ""
+
+    def _options_schema(self) -> dict[vol.Marker, Any]:
+        return {
+            vol.Optional(
+                CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(CONF_STREAM_KEY): str,
+        }
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["company", "search", "bulk"]
+        )
+
+    async def _async_create_company_entry(
+        self, api_key: str, company_number: str, user_input: dict[str, Any]
+    ) -> FlowResult:
+        """Validate a company and create its entry, raise CompaniesHouseError."""
+        client = async_get_api_client(self.hass, api_key)
+        # validate
+        info = await client.get_company_profile(company_number)
+
+        # the new entry is set up from the store, without fetching again
+        store = await async_get_profile_store(self.hass)
+        store.async_set(
+            company_number, info, *client.profile_validators(company_number)
+        )
+
+        data = {
+            CONF_API_KEY: api_key,
+            CONF_COMPANY_NUMBER: company_number,
+            CONF_UPDATE_INTERVAL: user_input.get(
+                CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+            ),
+        }
+        if stream_key := user_input.get(CONF_STREAM_KEY, "").strip():
+            data[CONF_STREAM_KEY] = stream_key
+
+        return self.async_create_entry(
+            title=info.company_name or company_number, data=data
+        )
+
+    async def async_step_company(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a single company."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            api_key = user_input[CONF_API_KEY].strip()
+            api_key = self._api_key(user_input)
             company_number = user_input[CONF_COMPANY_NUMBER].strip().upper()
 
+            # checked first, an abort must not be reported as an unknown error
+            await self.async_set_unique_id(company_number)
+            self._abort_if_unique_id_configured()
+
             try:
-                client = CompaniesHouseApiClient(self.hass, api_key)
-                # validate
-                info = await client.get_company_profile(company_number)
-
-                await self.async_set_unique_id(company_number)
-                self._abort_if_unique_id_configured()
-
-                data = {
-                    CONF_API_KEY: api_key,
-                    CONF_COMPANY_NUMBER: company_number,
-                    CONF_UPDATE_INTERVAL: user_input.get(
-                        CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                    ),
-                }
+                return await self._async_create_company_entry(
+                    api_key, company_number, user_input
+                )
+            except CompaniesHouseError as err:
+                errors["base"] = error_code(err)
+            except Exception:  # noqa: BLE001
+                errors["base"] = "unknown"
+
+        schema = vol.Schema(
+            {
+                **self._keys_schema(),
+                vol.Required(CONF_COMPANY_NUMBER): str,
+                **self._options_schema(),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="company", data_schema=schema, errors=errors
+        )
+
+    async def async_step_search(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle searching a company by name."""
+        errors: dict[str, str] = {}
 
-                return self.async_create_entry(
-                    title=info.get("company_name", company_number), data=data
+        if user_input is not None:
+            self._search_api_key = self._api_key(user_input)
+            client = async_get_api_client(self.hass, self._search_api_key)
+            search_cache = async_get_search_cache(self.hass, client)
+            try:
+                self._search_results = await search_cache.async_search(
+                    user_input[CONF_QUERY]
                 )
+            except CompaniesHouseError as err:
+                errors["base"] = error_code(err)
+            except Exception:  # noqa: BLE001
+                errors["base"] = "unknown"
+            else:
+                if self._search_results:
+                    return await self.async_step_search_select()
+                errors[CONF_QUERY] = "no_results"
 
-            except ValueError as err:
-                error_type = str(err)
-                if error_type in ["invalid_auth", "company_not_found", "bad_request"]:
-                    errors["base"] = error_type
-                else:
-                    errors["base"] = "cannot_connect"
+        schema = vol.Schema(
+            {
+                **self._keys_schema(),
+                vol.Required(
+                    CONF_QUERY,
+                    default=user_input.get(CONF_QUERY, "") if user_input else "",
+                ): str,
+            }
+        )
+
+        return self.async_show_form(step_id="search", data_schema=schema, errors=errors)
+
+    async def async_step_search_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle picking one of the companies found."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            company_number = user_input[CONF_COMPANY_NUMBER]
+            await self.async_set_unique_id(company_number)
+            self._abort_if_unique_id_configured()
+
+            try:
+                return await self._async_create_company_entry(
+                    self._search_api_key, company_number, user_input
+                )
+            except CompaniesHouseError as err:
+                errors["base"] = error_code(err)
             except Exception:  # noqa: BLE001
                 errors["base"] = "unknown"
 
         schema = vol.Schema(
             {
-                vol.Required(CONF_API_KEY): str,
-                vol.Required(CONF_COMPANY_NUMBER): str,
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+                vol.Required(CONF_COMPANY_NUMBER): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[
+                            SelectOptionDict(
+                                value=result.company_number, label=result.label
+                            )
+                            for result in self._search_results
+                        ],
+                        mode=SelectSelectorMode.LIST,
+                    )
+                ),
+                **self._options_schema(),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="search_select", data_schema=schema, errors=errors
+        )
+
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a list or CSV of companies in one pass."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            api_key = self._api_key(user_input)
+            company_numbers = parse_company_numbers(user_input[CONF_COMPANY_NUMBERS])
+
+            if not company_numbers:
+                errors[CONF_COMPANY_NUMBERS] = "no_company_numbers"
+            else:
+                results = await async_import_companies(
+                    self.hass,
+                    api_key,
+                    company_numbers,
+                    user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                    user_input.get(CONF_STREAM_KEY, "").strip() or None,
+                )
+                if all(result == "invalid_auth" for result in results.values()):
+                    errors["base"] = "invalid_auth"
+                else:
+                    return self.async_abort(
+                        reason="bulk_import_complete",
+                        description_placeholders={
+                            "added": str(
+                                sum(
+                                    result == RESULT_ADDED
+                                    for result in results.values()
+                                )
+                            ),
+                            "total": str(len(results)),
+                            "results": "\n".join(
+                                f"- {number}: {result}"
+                                for number, result in results.items()
+                            ),
+                        },
+                    )
+
+        schema = vol.Schema(
+            {
+                **self._keys_schema(),
+                vol.Required(CONF_COMPANY_NUMBERS): TextSelector(
+                    TextSelectorConfig(multiline=True)
+                ),
+                **self._options_schema(),
+            }
+        )
+
+        return self.async_show_form(step_id="bulk", data_schema=schema, errors=errors)
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create an entry for a company already validated by a bulk import."""
+        data = dict(import_data)
+        title = data.pop(CONF_COMPANY_NAME)
+
+        await self.async_set_unique_id(data[CONF_COMPANY_NUMBER])
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(title=title, data=data)
+
+
+class CompaniesHouseOptionsFlow(config_entries.OptionsFlow):
+    """Options flow of a company entry, applied without fetching it again."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the interval, cache and entities of the company."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_UPDATE_INTERVAL,
+                    default=options.get(
+                        CONF_UPDATE_INTERVAL,
+                        self.config_entry.data.get(
+                            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+                        ),
+                    ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required(
+                    CONF_CACHE_TTL, default=options.get(CONF_CACHE_TTL, CACHE_TTL)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_ENTITY_GROUPS,
+                    default=options.get(CONF_ENTITY_GROUPS, ENTITY_GROUPS),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=ENTITY_GROUPS,
+                        multiple=True,
+                        mode=SelectSelectorMode.LIST,
+                        translation_key=CONF_ENTITY_GROUPS,
+                    )
+                ),
             }
         )
 
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="init", data_schema=schema)
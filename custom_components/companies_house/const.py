@@ -9,10 +9,76 @@ _LOGGER = logging.getLogger(__package__)
 CONF_COMPANY_NUMBER = "company_number"
 CONF_API_KEY = "api_key"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_COMPANY_NAME = "company_name"
+CONF_COMPANY_NUMBERS = "company_numbers"
+CONF_PATH = "path"
+CONF_STREAM_KEY = "stream_key"
+CONF_QUERY = "query"
+CONF_ENTITY_GROUPS = "entity_groups"
+CONF_CACHE_TTL = "cache_ttl"
+CONF_HORIZON = "horizon"
+CONF_TRANSPORT = "transport"
+CONF_MODE = "mode"
+CONF_LATENCY = "latency"
+CONF_ERROR_RATE = "error_rate"
+CONF_ERROR_STATUS = "error_status"
+
+# entity groups a company entry can choose from
+ENTITY_GROUP_DEADLINES = "deadlines"
+ENTITY_GROUP_STATUS = "status"
+ENTITY_GROUP_DETAILS = "details"
+ENTITY_GROUP_FILINGS = "filings"
+ENTITY_GROUP_CONTROL = "control"
+ENTITY_GROUPS = [
+    ENTITY_GROUP_DEADLINES,
+    ENTITY_GROUP_STATUS,
+    ENTITY_GROUP_DETAILS,
+    ENTITY_GROUP_FILINGS,
+    ENTITY_GROUP_CONTROL,
+]
 
 # default values
 DEFAULT_UPDATE_INTERVAL = 720
 API_BASE_URL = "https://api.company-information.service.gov.uk"
+STREAM_URL = "https://stream.companieshouse.gov.uk/companies"
 
 # required by Companies House developer guidelines
 ATTRIBUTION = "Data provided by Companies House"
+
+# hass.data keys
+DATA_API_CLIENTS = "api_clients"
+DATA_RATE_LIMITERS = "rate_limiters"
+DATA_COORDINATORS = "coordinators"
+DATA_STORE = "store"
+DATA_FILING_STORE = "filing_store"
+DATA_STREAMS = "streams"
+DATA_CIRCUIT_BREAKERS = "circuit_breakers"
+DATA_METRICS = "metrics"
+DATA_SEARCH_CACHES = "search_caches"
+DATA_TRANSPORT = "transport"
+
+# Companies House allows 600 requests per 5 minutes per API key
+RATE_LIMIT_REQUESTS = 600
+RATE_LIMIT_WINDOW = 300
+
+# failed requests are retried with exponential backoff and jitter
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1
+MAX_RETRY_DELAY = 60
+
+# consecutive failures pausing all requests of an API key
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_MIN_OPEN_TIME = 60
+CIRCUIT_MAX_OPEN_TIME = 1800
+
+# profiles fetched in parallel by a coordinator refresh
+MAX_CONCURRENT_REQUESTS = 5
+
+# stale profiles restored at startup are refreshed within this many seconds
+STARTUP_REFRESH_JITTER = 300
+
+# companies due within this many seconds of each other are fetched together
+MIN_POLL_DELAY = 60
+# a company whose fetch failed is retried after this many seconds, doubled
+# with every further failure up to its normal interval
+FAILED_RETRY_DELAY = 60
@@ -1,49 +1,695 @@
 """Scheduled task for polling API."""
 
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Iterable
 from datetime import timedelta
+import time
+from typing import Any, TypeVar
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import CompaniesHouseApiClient, async_get_api_client
+from .const import (
+    _LOGGER,
+    DATA_COORDINATORS,
+    DOMAIN,
+    FAILED_RETRY_DELAY,
+    MAX_CONCURRENT_REQUESTS,
+    MIN_POLL_DELAY,
+    STARTUP_REFRESH_JITTER,
+)
+from .exceptions import (
+    CompaniesHouseAuthError,
+    CompaniesHouseCircuitOpenError,
+    CompaniesHouseError,
+)
+from .filings import (
+    EVENT_NEW_FILING,
+    FILING_BUFFER_SIZE,
+    FILING_INTERVAL,
+    Filing,
+    async_fetch_new_filings,
+)
+from .portfolio import CompaniesHousePortfolio
+from .profile import CompanyRecord, extract_record, merge_record
+from .resources import RESOURCES, ResourceSpec, ResourceSummary
+from .schedule import next_slot, phase, poll_interval, schedule_report
+from .storage import (
+    CompaniesHouseFilingStore,
+    CompaniesHouseProfileStore,
+    async_get_filing_store,
+    async_get_profile_store,
+)
 
-from .api import CompaniesHouseApiClient
-from .const import _LOGGER, DOMAIN
+_DataT = TypeVar("_DataT")
 
 
-class CompaniesHouseDataUpdateCoordinator(DataUpdateCoordinator[dict]):
-    """Coordinator for data updating."""
+class CompaniesHouseScheduledCoordinator(DataUpdateCoordinator[dict[str, _DataT]], ABC):
+    """Coordinator polling every company on its own schedule.
 
-    config_entry: ConfigEntry
+    Every company has its own next poll time, at a fixed phase of its
+    interval so that companies spread evenly. The coordinator wakes up when
+    the earliest company is due and fetches every company due by then.
+    """
 
     def __init__(
-        self,
-        hass: HomeAssistant,
-        api_client: CompaniesHouseApiClient,
-        company_number: str,
-        update_interval_minutes: int,
+        self, hass: HomeAssistant, api_client: CompaniesHouseApiClient, name: str
     ) -> None:
-        """Create a update task from company number and intervals."""
+        """Create an update task shared by all companies of an API key."""
         self.api_client = api_client
-        self.company_number = company_number
+        # company number -> unix time of its next poll
+        self._next_poll: dict[str, float] = {}
+        # company number -> consecutive failed polls
+        self._failures: dict[str, int] = {}
+        # companies whose data changed in the last refresh, None means all
+        self._changed_companies: set[str] | None = None
 
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{DOMAIN}_{company_number}",
-            update_interval=timedelta(minutes=update_interval_minutes),
+            config_entry=None,
+            name=name,
+            update_interval=None,
         )
+        self.data = {}
+
+    @abstractmethod
+    def _poll_interval(self, company_number: str) -> float:
+        """Return the seconds between two polls of a company."""
+
+    @abstractmethod
+    async def _async_fetch(self, company_number: str) -> _DataT:
+        """Fetch the data of a company."""
+
+    @callback
+    def _handle_changed(self, company_number: str, value: _DataT) -> None:
+        """Act on data of a company that differs from the previous poll."""
 
-    async def _async_update_data(self) -> dict:
+    @callback
+    def _handle_fetched(self, company_number: str) -> None:
+        """Act on any successful poll of a company, changed or not."""
+
+    def _next_poll_after(self, company_number: str, polled_at: float) -> float:
+        """Return the slot of a company following a poll."""
+        # companies due within MIN_POLL_DELAY are polled early, skip past it
+        return next_slot(
+            polled_at + MIN_POLL_DELAY,
+            self._poll_interval(company_number),
+            phase(company_number),
+        )
+
+    def _restored_next_poll(self, company_number: str, fetched_at: float) -> float:
+        """Return the next poll of a company whose data was stored."""
+        now = time.time()
+        if (next_poll := self._next_poll_after(company_number, fetched_at)) <= now:
+            # spread stale snapshots out to avoid a burst at startup
+            next_poll = now + phase(company_number) * STARTUP_REFRESH_JITTER
+        return next_poll
+
+    @callback
+    def _async_update_interval(self) -> None:
+        """Wake up when the earliest company is due."""
+        if not self._next_poll:
+            self.update_interval = None
+            return
+        delay = min(self._next_poll.values()) - time.time()
+        # while the circuit is open nothing is sent before the next probe
+        delay = max(delay, self.api_client.circuit_breaker.retry_in, MIN_POLL_DELAY)
+        self.update_interval = timedelta(seconds=delay)
+
+    @callback
+    def _async_reschedule(self) -> None:
+        """Move the pending refresh to the earliest company due."""
+        self._async_update_interval()
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def _async_update_data(self) -> dict[str, _DataT]:
+        start = time.monotonic()
         try:
-            return await self.api_client.get_company_profile(self.company_number)
-        except ValueError as err:
-            error_msg = str(err)
-            if error_msg == "invalid_auth":
+            data = await self._async_poll_due()
+        except UpdateFailed:
+            self.api_client.metrics.record_refresh(
+                self.name, time.monotonic() - start, success=False
+            )
+            raise
+        self.api_client.metrics.record_refresh(
+            self.name, time.monotonic() - start, success=True
+        )
+        return data
+
+    async def _async_poll_due(self) -> dict[str, _DataT]:
+        """Fetch every company due and return the updated data."""
+        # a previous failure marked every entity unavailable, so notify all
+        was_available = self.last_update_success
+        self._changed_companies = None
+
+        now = time.time()
+        numbers = [
+            number
+            for number, next_poll in self._next_poll.items()
+            if next_poll <= now + MIN_POLL_DELAY
+        ]
+        if not self.api_client.circuit_breaker.closed:
+            # probe with one company, the others follow once the API is back
+            numbers = numbers[:1]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _fetch(company_number: str) -> _DataT:
+            async with semaphore:
+                return await self._async_fetch(company_number)
+
+        results = await asyncio.gather(
+            *(_fetch(number) for number in numbers), return_exceptions=True
+        )
+
+        data = dict(self.data)
+        changed: set[str] = set()
+        auth_error: CompaniesHouseAuthError | None = None
+        now = time.time()
+        for number, result in zip(numbers, results, strict=True):
+            if number not in self._next_poll:
+                # removed while the request was in flight
+                continue
+            if isinstance(result, BaseException):
+                if isinstance(result, CompaniesHouseCircuitOpenError):
+                    # still due, polled as soon as the circuit closes
+                    continue
+                if isinstance(result, CompaniesHouseAuthError):
+                    auth_error = result
+                elif isinstance(result, CompaniesHouseError):
+                    _LOGGER.debug(
+                        "Error updating %s of %s: %s", self.name, number, result
+                    )
+                else:
+                    _LOGGER.exception(
+                        "Unexpected error updating %s of %s",
+                        self.name,
+                        number,
+                        exc_info=result,
+                    )
+                failures = self._failures[number] = self._failures.get(number, 0) + 1
+                if failures == 1:
+                    # the entities of the company become unavailable
+                    changed.add(number)
+                self._next_poll[number] = now + min(
+                    self._poll_interval(number),
+                    FAILED_RETRY_DELAY * 2 ** (failures - 1),
+                )
+                continue
+            if self._failures.pop(number, None):
+                changed.add(number)
+            # a 304 Not Modified hands back the very same cached dict
+            if (previous := data.get(number)) is not result and previous != result:
+                data[number] = result
+                changed.add(number)
+                self._handle_changed(number, result)
+            self._handle_fetched(number)
+            self._next_poll[number] = self._next_poll_after(number, now)
+
+        self._async_update_interval()
+
+        # a failed company only affects its own entities, only failures of
+        # the whole API key fail the refresh
+        if auth_error is not None or not self.api_client.circuit_breaker.closed:
+            # the data already fetched is kept
+            self.data = data
+            if auth_error is not None:
+                raise UpdateFailed("Invalid API Key") from auth_error
+            raise UpdateFailed("Companies House API unavailable, requests paused")
+
+        if was_available:
+            self._changed_companies = changed
+        return data
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the entities of companies whose data changed."""
+        changed = self._changed_companies
+        self._changed_companies = None
+        if changed is None:
+            super().async_update_listeners()
+            return
+        for update_callback, company_number in list(self._listeners.values()):
+            # entities of no company, like the metrics, follow every refresh
+            if company_number is None or company_number in changed:
+                update_callback()
+
+    @callback
+    def async_is_company_available(self, company_number: str) -> bool:
+        """Return if the data of a company is known and its last poll succeeded."""
+        return company_number in self.data and company_number not in self._failures
+
+    @callback
+    def async_get_diagnostics(self, company_number: str) -> dict[str, Any]:
+        """Return the schedule and state of a company."""
+        next_poll = self._next_poll.get(company_number)
+        return {
+            "has_data": company_number in self.data,
+            "next_poll": dt_util.utc_from_timestamp(next_poll).isoformat()
+            if next_poll is not None
+            else None,
+            "failures": self._failures.get(company_number, 0),
+            "update_interval": self.update_interval.total_seconds()
+            if self.update_interval is not None
+            else None,
+            "last_update_success": self.last_update_success,
+        }
+
+    @callback
+    def async_get_schedule_report(
+        self, horizon: float, bucket: float
+    ) -> dict[str, Any]:
+        """Return the requests planned over the next horizon seconds."""
+        return schedule_report(
+            {
+                number: (next_poll, self._poll_interval(number))
+                for number, next_poll in self._next_poll.items()
+            },
+            time.time(),
+            horizon,
+            bucket,
+        )
+
+    @callback
+    def async_update_company_listeners(self, company_numbers: Iterable[str]) -> None:
+        """Notify the entities of the given companies and of no company."""
+        company_numbers = set(company_numbers)
+        for update_callback, company_number in list(self._listeners.values()):
+            if company_number is None or company_number in company_numbers:
+                update_callback()
+
+
+class CompaniesHouseDataUpdateCoordinator(
+    CompaniesHouseScheduledCoordinator[CompanyRecord]
+):
+    """Coordinator polling the profile of every company tracked with one API key.
+
+    The interval of a company is derived from its configured interval and its
+    filing deadlines. Only the parsed record of a profile is kept.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: CompaniesHouseApiClient,
+        store: CompaniesHouseProfileStore,
+        filing_store: CompaniesHouseFilingStore,
+    ) -> None:
+        """Create a update task shared by all companies of an API key."""
+        self.store = store
+        # company number -> requested update interval in minutes
+        self._intervals: dict[str, int] = {}
+        # company number -> latest record, updated as soon as it changes while
+        # the data is replaced at the end of a refresh
+        self.records: dict[str, CompanyRecord] = {}
+        # company number -> device shared by the entities of the company
+        self._device_info: dict[str, DeviceInfo] = {}
+        # aggregates of the records, for the entities of the hub
+        self.portfolio = CompaniesHousePortfolio()
+        # resource key -> coordinator of officers, charges...
+        self._resource_coordinators: dict[str, CompaniesHouseResourceCoordinator] = {}
+        # loaded config entry -> callback adding the hub entities through it
+        self._hub_adders: dict[str, CALLBACK_TYPE] = {}
+        # config entry holding the entities of the hub
+        self._hub_entry_id: str | None = None
+
+        super().__init__(hass, api_client, f"{DOMAIN}_hub")
+
+        self.filing_coordinator = CompaniesHouseFilingCoordinator(
+            hass, api_client, filing_store
+        )
+
+    @property
+    def company_numbers(self) -> list[str]:
+        """Return the tracked company numbers."""
+        return list(self._intervals)
+
+    @property
+    def resource_coordinators(self) -> list[CompaniesHouseResourceCoordinator]:
+        """Return the coordinators of the resources used so far."""
+        return list(self._resource_coordinators.values())
+
+    @callback
+    def async_get_device_info(self, company_number: str) -> DeviceInfo:
+        """Return the device of a company, built once for all its entities."""
+        if (device_info := self._device_info.get(company_number)) is None:
+            record = self.records.get(company_number)
+            name = record.company_name if record is not None else None
+            device_info = self._device_info[company_number] = DeviceInfo(
+                identifiers={(DOMAIN, company_number)},
+                name=name or f"Company {company_number}",
+                manufacturer="Companies House UK",
+                model="Company Register",
+                entry_type="service",
+                configuration_url=f"https://find-and-update.company-information.service.gov.uk/company/{company_number}",
+            )
+        return device_info
+
+    @callback
+    def async_offer_hub_entities(
+        self, entry_id: str, add_hub_entities: CALLBACK_TYPE
+    ) -> None:
+        """Let a loaded config entry hold the hub entities.
+
+        The first entry set up adds them. They belong to one entry at a time
+        and move to another one when it unloads, without reloading anything.
+        """
+        self._hub_adders[entry_id] = add_hub_entities
+        if self._hub_entry_id is None:
+            self._hub_entry_id = entry_id
+            add_hub_entities()
+
+    @callback
+    def async_release_hub_entities(self, entry_id: str) -> None:
+        """Forget an unloaded entry, moving the hub entities it held."""
+        self._hub_adders.pop(entry_id, None)
+        if self._hub_entry_id != entry_id:
+            return
+        self._hub_entry_id = next(iter(self._hub_adders), None)
+        if self._hub_entry_id is not None:
+            self._hub_adders[self._hub_entry_id]()
+
+    def _poll_interval(self, company_number: str) -> float:
+        """Return the seconds between two polls of a company."""
+        return poll_interval(
+            self.records[company_number],
+            timedelta(minutes=self._intervals[company_number]),
+            dt_util.utcnow().date(),
+        ).total_seconds()
+
+    async def _async_fetch(self, company_number: str) -> CompanyRecord:
+        return await self.api_client.get_company_profile(company_number)
+
+    @callback
+    def _handle_changed(self, company_number: str, value: CompanyRecord) -> None:
+        self.records[company_number] = value
+        self.portfolio.update(company_number, value)
+        self.store.async_set(company_number, value)
+        # most filings change the profile, look for them right away
+        self.filing_coordinator.async_request_poll(company_number)
+
+    @callback
+    def _handle_fetched(self, company_number: str) -> None:
+        # the fetch time decides the first poll after a restart
+        self.store.async_touch(
+            company_number, *self.api_client.profile_validators(company_number)
+        )
+
+    @callback
+    def async_get_resource_coordinator(
+        self, resource: str
+    ) -> CompaniesHouseResourceCoordinator:
+        """Return the coordinator of a resource, polled on its own cadence."""
+        if (coordinator := self._resource_coordinators.get(resource)) is None:
+            coordinator = self._resource_coordinators[resource] = (
+                CompaniesHouseResourceCoordinator(
+                    self.hass, self.api_client, RESOURCES[resource]
+                )
+            )
+        return coordinator
+
+    @callback
+    def async_get_schedule_reports(
+        self, horizon: float, bucket: float
+    ) -> dict[str, dict[str, Any]]:
+        """Return the planned requests of the profiles and of every resource."""
+        return {
+            coordinator.name: coordinator.async_get_schedule_report(horizon, bucket)
+            for coordinator in (
+                self,
+                *self._resource_coordinators.values(),
+                self.filing_coordinator,
+            )
+        }
+
+    async def async_shutdown(self) -> None:
+        """Cancel the refreshes of the profiles and of every resource."""
+        for coordinator in self._resource_coordinators.values():
+            await coordinator.async_shutdown()
+        await self.filing_coordinator.async_shutdown()
+        await super().async_shutdown()
+
+    async def async_add_company(
+        self, company_number: str, update_interval_minutes: int
+    ) -> None:
+        """Track a company, making its profile available before entities are created.
+
+        A stored snapshot is used right away and refreshed in the background
+        once it is due, otherwise the profile has to be fetched before setup
+        continues.
+        """
+        now = time.time()
+        if (snapshot := self.store.get(company_number)) is not None:
+            record, fetched_at = snapshot
+            # an unchanged profile is then revalidated with a 304
+            self.api_client.restore_profile(
+                company_number, record, *self.store.get_validators(company_number)
+            )
+        else:
+            try:
+                record = await self.api_client.get_company_profile(company_number)
+            except CompaniesHouseAuthError as err:
                 raise ConfigEntryAuthFailed("Invalid API Key") from err
-            if error_msg == "company_not_found":
-                raise UpdateFailed(f"Company {self.company_number} not found") from err
-            if error_msg == "bad_request":
-                raise UpdateFailed("API returned Bad Request") from err
+            except CompaniesHouseError as err:
+                raise ConfigEntryNotReady(
+                    f"Error fetching company {company_number}: {err}"
+                ) from err
+            fetched_at = now
+            self.store.async_set(
+                company_number,
+                record,
+                *self.api_client.profile_validators(company_number),
+            )
+
+        self._intervals[company_number] = update_interval_minutes
+        self.data[company_number] = self.records[company_number] = record
+        self.portfolio.update(company_number, record)
+
+        self._next_poll[company_number] = self._restored_next_poll(
+            company_number, fetched_at
+        )
+        self._async_reschedule()
+        self.async_update_company_listeners(())
+
+    @callback
+    def async_set_update_interval(
+        self, company_number: str, update_interval_minutes: int
+    ) -> None:
+        """Change the interval of a company, moving its next poll along."""
+        if company_number not in self._intervals:
+            return
+        polled_at = self._next_poll[company_number] - self._poll_interval(
+            company_number
+        )
+        self._intervals[company_number] = update_interval_minutes
+        self._next_poll[company_number] = max(
+            self._next_poll_after(company_number, polled_at), time.time()
+        )
+        self._async_reschedule()
+
+    async def async_remove_company(self, company_number: str) -> None:
+        """Stop tracking a company."""
+        self._intervals.pop(company_number, None)
+        self._next_poll.pop(company_number, None)
+        self._failures.pop(company_number, None)
+        self.data.pop(company_number, None)
+        self.records.pop(company_number, None)
+        self._device_info.pop(company_number, None)
+        self.portfolio.remove(company_number)
+        self.api_client.forget_company(company_number)
+        self._async_reschedule()
+        self.async_update_company_listeners(())
+
+    @callback
+    def async_push_profiles(
+        self, profiles: dict[str, dict], *, merge: bool = True
+    ) -> None:
+        """Take profiles from another source, postponing their next poll.
+
+        Partial profiles are merged over the current records, complete
+        profiles (merge=False) replace them.
+        """
+        changed: set[str] = set()
+        now = time.time()
+        for number, update in profiles.items():
+            if number not in self._intervals:
+                continue
+            current = self.records[number]
+            record = merge_record(current, update) if merge else extract_record(update)
+            if record != current:
+                self.data[number] = record
+                self._handle_changed(number, record)
+                changed.add(number)
+            self._next_poll[number] = self._next_poll_after(number, now)
+
+        self._async_reschedule()
+        if changed:
+            self.async_update_company_listeners(changed)
+
+
+class CompaniesHouseOnDemandCoordinator(CompaniesHouseScheduledCoordinator[_DataT]):
+    """Coordinator polling only the companies that need it.
+
+    Companies are registered by enabled entities, so data nobody looks at
+    costs no API calls.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, api_client: CompaniesHouseApiClient, name: str
+    ) -> None:
+        """Create an update task polling registered companies."""
+        # company number -> entities using the data
+        self._users: dict[str, int] = {}
+
+        super().__init__(hass, api_client, name)
+
+    @callback
+    def _first_poll(self, company_number: str) -> float:
+        """Return when to poll a newly registered company."""
+        # registrations arriving together are fetched in one refresh
+        return time.time()
+
+    @callback
+    def async_register(self, company_number: str) -> CALLBACK_TYPE:
+        """Start polling a company, return a callback to stop."""
+        self._users[company_number] = self._users.get(company_number, 0) + 1
+        if company_number not in self._next_poll:
+            self._next_poll[company_number] = self._first_poll(company_number)
+            self._async_reschedule()
+
+        @callback
+        def _unregister() -> None:
+            self._users[company_number] -= 1
+            if self._users[company_number]:
+                return
+            del self._users[company_number]
+            self._next_poll.pop(company_number, None)
+            self._failures.pop(company_number, None)
+            self.data.pop(company_number, None)
+            self._async_reschedule()
+
+        return _unregister
+
+    @callback
+    def async_request_poll(self, company_number: str) -> None:
+        """Poll a registered company at the next refresh."""
+        if company_number in self._next_poll:
+            self._next_poll[company_number] = time.time()
+            self._async_reschedule()
+
+
+class CompaniesHouseResourceCoordinator(
+    CompaniesHouseOnDemandCoordinator[ResourceSummary]
+):
+    """Coordinator polling one resource of the companies that need it."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: CompaniesHouseApiClient,
+        resource: ResourceSpec,
+    ) -> None:
+        """Create an update task of a resource."""
+        self.resource = resource
+
+        super().__init__(hass, api_client, f"{DOMAIN}_{resource.key}")
+
+    def _poll_interval(self, company_number: str) -> float:
+        return self.resource.interval.total_seconds()
+
+    async def _async_fetch(self, company_number: str) -> ResourceSummary:
+        return await self.resource.async_summarize(self.api_client, company_number)
+
+
+class CompaniesHouseFilingCoordinator(
+    CompaniesHouseOnDemandCoordinator[tuple[Filing, ...]]
+):
+    """Coordinator following the filing history of the companies that need it.
+
+    Only filings newer than the last one seen are fetched, the most recent
+    ones are kept and every new filing fires an event.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: CompaniesHouseApiClient,
+        store: CompaniesHouseFilingStore,
+    ) -> None:
+        """Create an update task of the filing history."""
+        self.store = store
+
+        super().__init__(hass, api_client, f"{DOMAIN}_filing_history")
+
+    def _poll_interval(self, company_number: str) -> float:
+        return FILING_INTERVAL.total_seconds()
+
+    @callback
+    def _first_poll(self, company_number: str) -> float:
+        # the stored filings are the cursor, without them the history is new
+        if (snapshot := self.store.get(company_number)) is None:
+            return super()._first_poll(company_number)
+        self.data[company_number], fetched_at = snapshot
+        return self._restored_next_poll(company_number, fetched_at)
+
+    async def _async_fetch(self, company_number: str) -> tuple[Filing, ...]:
+        known = self.data.get(company_number, ())
+        new = await async_fetch_new_filings(self.api_client, company_number, known)
+        if not new:
+            # the very same tuple, nothing to notify
+            return known
+        return (*new, *known)[:FILING_BUFFER_SIZE]
+
+    @callback
+    def _handle_changed(self, company_number: str, value: tuple[Filing, ...]) -> None:
+        self.store.async_set(company_number, value)
+        if (known := self.data.get(company_number)) is None:
+            # the first fetch of a company is history, not news
+            return
+        known_ids = {filing.transaction_id for filing in known}
+        for filing in reversed(value):
+            if filing.transaction_id not in known_ids:
+                self.hass.bus.async_fire(
+                    EVENT_NEW_FILING,
+                    {"company_number": company_number, **filing.as_dict()},
+                )
+
+    @callback
+    def _handle_fetched(self, company_number: str) -> None:
+        # the fetch time decides the first poll after a restart
+        self.store.async_touch(company_number)
+
+
+async def async_get_coordinator(
+    hass: HomeAssistant, api_key: str
+) -> CompaniesHouseDataUpdateCoordinator:
+    """Return the coordinator shared by all config entries of an API key."""
+    store = await async_get_profile_store(hass)
+    filing_store = await async_get_filing_store(hass)
+    coordinators: dict[str, CompaniesHouseDataUpdateCoordinator] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_COORDINATORS, {})
+    if (coordinator := coordinators.get(api_key)) is None:
+        coordinator = coordinators[api_key] = CompaniesHouseDataUpdateCoordinator(
+            hass, async_get_api_client(hass, api_key), store, filing_store
+        )
+    return coordinator
+
 
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+async def async_release_coordinator(hass: HomeAssistant, api_key: str) -> None:
+    """Shut down the coordinator of an API key once no company uses it."""
+    coordinators: dict[str, CompaniesHouseDataUpdateCoordinator] = hass.data[DOMAIN][
+        DATA_COORDINATORS
+    ]
+    coordinator = coordinators.get(api_key)
+    if coordinator is not None and not coordinator.company_numbers:
+        del coordinators[api_key]
+        await coordinator.async_shutdown()
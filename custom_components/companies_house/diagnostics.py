@@ -0,0 +1,91 @@
+"""Diagnostics support for Companies House."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_API_KEY,
+    CONF_COMPANY_NUMBER,
+    CONF_STREAM_KEY,
+    DATA_STREAMS,
+    DOMAIN,
+    RATE_LIMIT_WINDOW,
+)
+from .coordinator import CompaniesHouseDataUpdateCoordinator
+
+TO_REDACT = {CONF_API_KEY, CONF_STREAM_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the state of a company and the metrics of its API key."""
+    coordinator: CompaniesHouseDataUpdateCoordinator = entry.runtime_data
+    company_number = entry.data[CONF_COMPANY_NUMBER]
+    api_client = coordinator.api_client
+    metrics = api_client.metrics
+    rate_limiter = api_client.rate_limiter
+    record = coordinator.records.get(company_number)
+    fetch_latency = metrics.fetch_latency.get(company_number)
+    portfolio = coordinator.portfolio
+
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "company": {
+            "record": asdict(record) if record is not None else None,
+            "fetch_latency": fetch_latency.as_dict() if fetch_latency else None,
+            "schedule": coordinator.async_get_diagnostics(company_number),
+            "resources": {
+                resource.name: resource.async_get_diagnostics(company_number)
+                for resource in (
+                    *coordinator.resource_coordinators,
+                    coordinator.filing_coordinator,
+                )
+            },
+        },
+        "hub": {
+            "companies": len(coordinator.company_numbers),
+            "portfolio": {
+                "statuses": dict(portfolio.statuses),
+                "accounts_overdue": portfolio.accounts_overdue,
+                "confirmation_statement_overdue": (
+                    portfolio.confirmation_statement_overdue
+                ),
+                "upcoming": [asdict(deadline) for deadline in portfolio.upcoming(10)],
+            },
+            "metrics": metrics.as_dict(),
+            "rate_limit": {
+                "remaining": rate_limiter.remaining,
+                "reset_at": rate_limiter.reset_at,
+                "queue_depth": rate_limiter.queue_depth,
+                "wait_time": rate_limiter.wait_time,
+            },
+            "circuit": {
+                "closed": api_client.circuit_breaker.closed,
+                "retry_in": api_client.circuit_breaker.retry_in,
+            },
+            # requests planned over the next day, per rate limit window
+            "schedule": coordinator.async_get_schedule_reports(
+                24 * 3600, RATE_LIMIT_WINDOW
+            ),
+        },
+    }
+
+    if stream_key := entry.data.get(CONF_STREAM_KEY):
+        consumer = hass.data[DOMAIN].get(DATA_STREAMS, {}).get(stream_key)
+        diagnostics["stream"] = (
+            {
+                "timepoint": consumer.timepoint,
+                "companies": len(consumer.company_numbers),
+            }
+            if consumer is not None
+            else None
+        )
+
+    return diagnostics
@@ -1,10 +1,85 @@
 """Define entity for companies."""
 
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN
-from .coordinator import CompaniesHouseDataUpdateCoordinator
+from .const import (
+    ATTRIBUTION,
+    CONF_COMPANY_NUMBER,
+    CONF_ENTITY_GROUPS,
+    DOMAIN,
+    ENTITY_GROUPS,
+)
+from .coordinator import (
+    CompaniesHouseDataUpdateCoordinator,
+    CompaniesHouseOnDemandCoordinator,
+)
+from .profile import CompanyRecord
+
+_EMPTY_RECORD = CompanyRecord()
+
+
+@dataclass(frozen=True, kw_only=True)
+class CompaniesHouseEntityDescription(EntityDescription):
+    """Entity description of a company, part of an entity group."""
+
+    group: str
+
+
+_DescriptionT = TypeVar("_DescriptionT", bound=CompaniesHouseEntityDescription)
+
+
+@callback
+def async_is_disabled(hass: HomeAssistant, domain: str, unique_id: str) -> bool:
+    """Return if an entity is registered as disabled.
+
+    Such entities are not created at all, enabling one reloads its entry.
+    """
+    registry = er.async_get(hass)
+    if (entity_id := registry.async_get_entity_id(domain, DOMAIN, unique_id)) is None:
+        return False
+    return registry.entities[entity_id].disabled
+
+
+@callback
+def async_company_descriptions(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    domain: str,
+    descriptions: Iterable[_DescriptionT],
+) -> list[_DescriptionT]:
+    """Return the descriptions of the entities to create for the company of an entry.
+
+    Entities of the groups left out are removed from the registry.
+    """
+    groups = entry.options.get(CONF_ENTITY_GROUPS, ENTITY_GROUPS)
+    company_number = entry.data[CONF_COMPANY_NUMBER]
+    registry = er.async_get(hass)
+    wanted = []
+    for description in descriptions:
+        unique_id = f"{company_number}_{description.key}"
+        if description.group in groups:
+            if not async_is_disabled(hass, domain, unique_id):
+                wanted.append(description)
+        elif entity_id := registry.async_get_entity_id(domain, DOMAIN, unique_id):
+            registry.async_remove(entity_id)
+    return wanted
+
+
+def hub_unique_id(coordinator: CompaniesHouseDataUpdateCoordinator, key: str) -> str:
+    """Return the unique ID of a hub entity."""
+    return f"hub_{coordinator.api_client.key_id}_{key}"
 
 
 class CompaniesHouseEntity(CoordinatorEntity[CompaniesHouseDataUpdateCoordinator]):
@@ -14,19 +89,106 @@ class CompaniesHouseEntity(CoordinatorEntity[CompaniesHouseDataUpdateCoordinator
     _attr_attribution = ATTRIBUTION
 
     def __init__(
-        self, coordinator: CompaniesHouseDataUpdateCoordinator, key: str
+        self,
+        coordinator: CompaniesHouseDataUpdateCoordinator,
+        company_number: str,
+        key: str,
     ) -> None:
         """Create a company entity."""
+        # the company number is the listener context, so the coordinator only
+        # notifies this entity when the profile of its own company changed
+        super().__init__(coordinator, context=company_number)
+        self.company_number = company_number
+        self._attr_unique_id = f"{company_number}_{key}"
+        self._attr_device_info = coordinator.async_get_device_info(company_number)
+        self._last_available = self.available
+
+    @abstractmethod
+    def _update_value(self) -> bool:
+        """Recompute the derived state from the profile, return if it changed."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the derived value or availability changed."""
+        available = self.available
+        if not self._update_value() and available == self._last_available:
+            return
+        self._last_available = available
+        self.async_write_ha_state()
+
+    @property
+    def company_record(self) -> CompanyRecord:
+        """Return the extracted profile values of this entity's company."""
+        return self.coordinator.records.get(self.company_number, _EMPTY_RECORD)
+
+    @property
+    def available(self) -> bool:
+        """Return if the company profile is available."""
+        return super().available and self.coordinator.async_is_company_available(
+            self.company_number
+        )
+
+
+class CompaniesHouseOnDemandEntity(CompaniesHouseEntity):
+    """Company entity whose data is fetched by an on demand coordinator.
+
+    The company is only polled while the entity is added, which never
+    happens for a disabled entity.
+    """
+
+    def __init__(
+        self,
+        coordinator: CompaniesHouseDataUpdateCoordinator,
+        source: CompaniesHouseOnDemandCoordinator,
+        company_number: str,
+        key: str,
+    ) -> None:
+        """Create a company entity reading the data of another coordinator."""
+        self.source = source
+        super().__init__(coordinator, company_number, key)
+
+    async def async_added_to_hass(self) -> None:
+        """Start polling the data of this company."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.source.async_register(self.company_number))
+        self.async_on_remove(
+            self.source.async_add_listener(
+                self._handle_coordinator_update, self.company_number
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if the data of the company has been fetched."""
+        # a refresh only fails for the whole API key, otherwise each company
+        # is available while its own last poll succeeded
+        return self.source.last_update_success and (
+            self.source.async_is_company_available(self.company_number)
+        )
+
+
+class CompaniesHouseHubEntity(CoordinatorEntity[CompaniesHouseDataUpdateCoordinator]):
+    """Entity of the API key shared by the companies, on its own device."""
+
+    _attr_has_entity_name = True
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(
+        self, coordinator: CompaniesHouseDataUpdateCoordinator, key: str
+    ) -> None:
+        """Create a hub entity."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.company_number}_{key}"
+        self._attr_unique_id = hub_unique_id(coordinator, key)
 
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.company_number)},
-            name=coordinator.data.get(
-                "company_name", f"Company {coordinator.company_number}"
-            ),
+            identifiers={(DOMAIN, f"hub_{coordinator.api_client.key_id}")},
+            name="Companies House API",
             manufacturer="Companies House UK",
-            model="Company Register",
+            model="Public Data API",
             entry_type="service",
-            configuration_url=f"https://find-and-update.company-information.service.gov.uk/company/{coordinator.company_number}",
         )
+
+    @property
+    def available(self) -> bool:
+        """Return True, the metrics matter most when the API fails."""
+        return True
@@ -0,0 +1,65 @@
+"""Errors raised by the API client."""
+
+from __future__ import annotations
+
+
+class CompaniesHouseError(ValueError):
+    """Base error, str() is the error code shown by the config flow."""
+
+    code = "unknown_error"
+    # a later attempt of the same request may succeed
+    retryable = False
+    # the API itself looks unavailable, counted by the circuit breaker
+    outage = False
+
+    def __init__(self, retry_after: float | None = None) -> None:
+        """Create the error, optionally with the seconds to wait before retrying."""
+        super().__init__(self.code)
+        self.retry_after = retry_after
+
+
+class CompaniesHouseAuthError(CompaniesHouseError):
+    """The API key was rejected."""
+
+    code = "invalid_auth"
+
+
+class CompaniesHouseNotFoundError(CompaniesHouseError):
+    """The company does not exist."""
+
+    code = "company_not_found"
+
+
+class CompaniesHouseBadRequestError(CompaniesHouseError):
+    """The request was malformed, usually an invalid company number."""
+
+    code = "bad_request"
+
+
+class CompaniesHouseRateLimitError(CompaniesHouseError):
+    """The API answered 429 Too Many Requests."""
+
+    code = "rate_limited"
+    retryable = True
+
+
+class CompaniesHouseServerError(CompaniesHouseError):
+    """The API answered with a 5xx status."""
+
+    code = "api_error"
+    retryable = True
+    outage = True
+
+
+class CompaniesHouseConnectionError(CompaniesHouseError):
+    """The API could not be reached or did not answer in time."""
+
+    code = "connection_error"
+    retryable = True
+    outage = True
+
+
+class CompaniesHouseCircuitOpenError(CompaniesHouseError):
+    """Requests are paused after repeated failures of the API."""
+
+    code = "circuit_open"
@@ -0,0 +1,98 @@
+"""Recent filings of a company, fetched incrementally."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from .const import DOMAIN
+from .profile import parse_date
+
+if TYPE_CHECKING:
+    from .api import CompaniesHouseApiClient
+
+# filings kept per company, also the most fetched without a cursor
+FILING_BUFFER_SIZE = 20
+# most filings change the profile, which triggers a fetch right away
+FILING_INTERVAL = timedelta(days=1)
+
+EVENT_NEW_FILING = f"{DOMAIN}_new_filing"
+
+
+@dataclass(frozen=True, slots=True)
+class Filing:
+    """A filing history item, reduced to what entities and events use."""
+
+    transaction_id: str
+    date: date | None
+    category: str | None
+    type: str | None
+    description: str | None
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any]) -> Filing | None:
+        """Create a filing from a filing history item, None without an ID."""
+        if not (transaction_id := item.get("transaction_id")):
+            return None
+        return cls(
+            transaction_id=transaction_id,
+            date=parse_date(item.get("date")),
+            category=item.get("category"),
+            type=item.get("type"),
+            description=item.get("description"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Filing:
+        """Create a filing from its stored form."""
+        return cls(
+            transaction_id=data["transaction_id"],
+            date=parse_date(data.get("date")),
+            category=data.get("category"),
+            type=data.get("type"),
+            description=data.get("description"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stored form of the filing."""
+        return {
+            "transaction_id": self.transaction_id,
+            "date": self.date.isoformat() if self.date else None,
+            "category": self.category,
+            "type": self.type,
+            "description": self.description,
+        }
+
+
+async def async_fetch_new_filings(
+    api_client: CompaniesHouseApiClient,
+    company_number: str,
+    known: Sequence[Filing],
+) -> list[Filing]:
+    """Return the filings newer than the known ones, newest first.
+
+    The history is sorted newest first, so paging stops at the first known
+    filing, or at one older than the newest known if that one disappeared.
+    """
+    known_ids = {filing.transaction_id for filing in known}
+    cursor_date = known[0].date if known else None
+
+    new: list[Filing] = []
+    async with aclosing(
+        api_client.iter_filing_history(company_number, FILING_BUFFER_SIZE)
+    ) as items:
+        async for item in items:
+            if (filing := Filing.from_item(item)) is None:
+                # a malformed item must not block the rest of the history
+                continue
+            if filing.transaction_id in known_ids:
+                break
+            if cursor_date and filing.date and filing.date < cursor_date:
+                break
+            new.append(filing)
+            if len(new) >= FILING_BUFFER_SIZE:
+                break
+    return new
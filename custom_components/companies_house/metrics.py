@@ -0,0 +1,222 @@
+"""Runtime metrics of the API clients and coordinators."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_METRICS, DOMAIN
+
+# upper bounds of the latency buckets in seconds, the last one is unbounded
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Fixed bucket histogram of durations."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count a duration."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration in seconds."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding the q-quantile."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.maximum
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in a serializable form."""
+        return {
+            "buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS, self.counts, strict=False)
+                },
+                "inf": self.counts[-1],
+            },
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.maximum,
+        }
+
+
+@dataclass(slots=True)
+class RefreshStats:
+    """Outcome of the refreshes of one coordinator."""
+
+    count: int = 0
+    failures: int = 0
+    last_duration: float | None = None
+    last_success: float | None = None
+
+
+class CompaniesHouseMetrics:
+    """Counters shared by every client and coordinator of an API key.
+
+    Only counters and fixed size histograms are kept, so recording costs a
+    few additions per request.
+    """
+
+    def __init__(self) -> None:
+        """Create empty metrics."""
+        self.started_at = time.time()
+        self.requests = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.statuses: Counter[int] = Counter()
+        self.errors: Counter[str] = Counter()
+        # profile requests sent with validators, and those answered 304
+        self.profile_fetches = 0
+        self.conditional_requests = 0
+        self.not_modified = 0
+        # profile calls answered without a request of their own
+        self.micro_cache_hits = 0
+        self.coalesced = 0
+        self.request_latency = LatencyHistogram()
+        # company number -> latency of its profile fetches, retries included
+        self.fetch_latency: dict[str, LatencyHistogram] = {}
+        # coordinator name -> refreshes
+        self.refreshes: dict[str, RefreshStats] = {}
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Return the share of revalidated profiles that were still fresh."""
+        if not self.conditional_requests:
+            return None
+        return self.not_modified / self.conditional_requests
+
+    @property
+    def not_modified_rate(self) -> float | None:
+        """Return the share of profile fetches answered 304 Not Modified."""
+        if not self.profile_fetches:
+            return None
+        return self.not_modified / self.profile_fetches
+
+    @property
+    def last_success(self) -> float | None:
+        """Return when a coordinator last refreshed successfully."""
+        return max(
+            (
+                stats.last_success
+                for stats in self.refreshes.values()
+                if stats.last_success is not None
+            ),
+            default=None,
+        )
+
+    def record_response(self, status: int, seconds: float, size: int) -> None:
+        """Count an HTTP response."""
+        self.requests += 1
+        self.statuses[status] += 1
+        self.bytes_received += size
+        self.request_latency.observe(seconds)
+
+    def record_error(self, code: str) -> None:
+        """Count a failed request."""
+        self.errors[code] += 1
+
+    def record_retry(self) -> None:
+        """Count a retried request."""
+        self.retries += 1
+
+    def record_micro_cache_hit(self) -> None:
+        """Count a profile served from a response of the last seconds."""
+        self.micro_cache_hits += 1
+
+    def record_coalesced(self) -> None:
+        """Count a profile call joining a request already in flight."""
+        self.coalesced += 1
+
+    def record_profile_fetch(
+        self,
+        company_number: str,
+        seconds: float,
+        *,
+        conditional: bool,
+        not_modified: bool,
+    ) -> None:
+        """Count a profile fetch of a company."""
+        self.profile_fetches += 1
+        self.conditional_requests += conditional
+        self.not_modified += not_modified
+        if (histogram := self.fetch_latency.get(company_number)) is None:
+            histogram = self.fetch_latency[company_number] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def forget_company(self, company_number: str) -> None:
+        """Drop the histogram of a company that is no longer tracked."""
+        self.fetch_latency.pop(company_number, None)
+
+    def record_refresh(self, name: str, seconds: float, *, success: bool) -> None:
+        """Count a coordinator refresh."""
+        if (stats := self.refreshes.get(name)) is None:
+            stats = self.refreshes[name] = RefreshStats()
+        stats.count += 1
+        stats.last_duration = seconds
+        if success:
+            stats.last_success = time.time()
+        else:
+            stats.failures += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every metric in a serializable form."""
+        return {
+            "started_at": self.started_at,
+            "requests": self.requests,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+            "profile_fetches": self.profile_fetches,
+            "conditional_requests": self.conditional_requests,
+            "not_modified": self.not_modified,
+            "micro_cache_hits": self.micro_cache_hits,
+            "coalesced": self.coalesced,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "not_modified_rate": self.not_modified_rate,
+            "request_latency": self.request_latency.as_dict(),
+            "refreshes": {
+                name: {
+                    "count": stats.count,
+                    "failures": stats.failures,
+                    "last_duration": stats.last_duration,
+                    "last_success": stats.last_success,
+                }
+                for name, stats in self.refreshes.items()
+            },
+        }
+
+
+def async_get_metrics(hass: HomeAssistant, api_key: str) -> CompaniesHouseMetrics:
+    """Return the metrics shared by all clients of an API key."""
+    metrics: dict[str, CompaniesHouseMetrics] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_METRICS, {})
+    if (key_metrics := metrics.get(api_key)) is None:
+        key_metrics = metrics[api_key] = CompaniesHouseMetrics()
+    return key_metrics
@@ -0,0 +1,118 @@
+"""Aggregates over every company of an API key, kept up to date incrementally."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+import heapq
+
+from .profile import CompanyRecord
+
+DEADLINE_ACCOUNTS = "accounts"
+DEADLINE_CONFIRMATION_STATEMENT = "confirmation_statement"
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """A filing due by a company."""
+
+    due: date
+    company_number: str
+    kind: str
+
+
+def _deadlines(record: CompanyRecord) -> tuple[tuple[str, date | None], ...]:
+    return (
+        (DEADLINE_ACCOUNTS, record.accounts_next_due),
+        (DEADLINE_CONFIRMATION_STATEMENT, record.confirmation_statement_next_due),
+    )
+
+
+class CompaniesHousePortfolio:
+    """Counters and upcoming deadlines of the tracked companies.
+
+    A changed company only undoes its previous contribution and adds the new
+    one. Deadlines sit in a min-heap, entries replaced by a newer date are
+    left in place and skipped when they reach the top.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty portfolio."""
+        self._records: dict[str, CompanyRecord] = {}
+        self.statuses: Counter[str] = Counter()
+        self.accounts_overdue = 0
+        self.confirmation_statement_overdue = 0
+        # (company number, kind) -> current due date
+        self._due: dict[tuple[str, str], date] = {}
+        self._heap: list[tuple[date, str, str]] = []
+
+    def __len__(self) -> int:
+        """Return the number of companies."""
+        return len(self._records)
+
+    def update(self, company_number: str, record: CompanyRecord) -> None:
+        """Count the new record of a company instead of the previous one."""
+        if (previous := self._records.get(company_number)) is record:
+            return
+        if previous is not None:
+            self._count(previous, -1)
+        self._records[company_number] = record
+        self._count(record, 1)
+        for kind, due in _deadlines(record):
+            key = (company_number, kind)
+            if due is None:
+                self._due.pop(key, None)
+            elif self._due.get(key) != due:
+                self._due[key] = due
+                heapq.heappush(self._heap, (due, company_number, kind))
+        self._compact()
+
+    def remove(self, company_number: str) -> None:
+        """Stop counting a company."""
+        if (previous := self._records.pop(company_number, None)) is None:
+            return
+        self._count(previous, -1)
+        for kind, _ in _deadlines(previous):
+            self._due.pop((company_number, kind), None)
+        self._compact()
+
+    def _count(self, record: CompanyRecord, sign: int) -> None:
+        if status := record.company_status:
+            self.statuses[status] += sign
+            if not self.statuses[status]:
+                del self.statuses[status]
+        self.accounts_overdue += sign * bool(record.accounts_overdue)
+        self.confirmation_statement_overdue += sign * bool(
+            record.confirmation_statement_overdue
+        )
+
+    def _is_current(self, entry: tuple[date, str, str]) -> bool:
+        due, company_number, kind = entry
+        return self._due.get((company_number, kind)) == due
+
+    def _compact(self) -> None:
+        """Rebuild the heap once stale entries outnumber the current ones."""
+        if len(self._heap) > 2 * len(self._due) + 16:
+            self._heap = [(due, *key) for key, due in self._due.items()]
+            heapq.heapify(self._heap)
+
+    @property
+    def next_deadline(self) -> Deadline | None:
+        """Return the earliest deadline of any company."""
+        heap = self._heap
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+        return Deadline(*heap[0]) if heap else None
+
+    def upcoming(self, count: int) -> list[Deadline]:
+        """Return the earliest deadlines, soonest first."""
+        # a date changed back and forth is in the heap twice
+        entries = set(filter(self._is_current, self._heap))
+        return [Deadline(*entry) for entry in heapq.nsmallest(count, entries)]
+
+    def company_name(self, company_number: str) -> str | None:
+        """Return the name of a company."""
+        if (record := self._records.get(company_number)) is None:
+            return None
+        return record.company_name
@@ -0,0 +1,225 @@
+"""Extract the values used by entities from a company profile."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+from datetime import date
+import sys
+from typing import Any
+
+
+def parse_date(date_str: str | None) -> date | None:
+    """Parse a Companies House date (YYYY-MM-DD)."""
+    if not date_str:
+        return None
+    try:
+        return date.fromisoformat(date_str)
+    except (TypeError, ValueError):
+        return None
+
+
+def format_address(address_data: dict | None) -> str | None:
+    """Format an address dictionary into a string."""
+    if not address_data or not isinstance(address_data, dict):
+        return None
+
+    parts = [
+        address_data.get("premises"),
+        address_data.get("address_line_1"),
+        address_data.get("address_line_2"),
+        address_data.get("locality"),
+        address_data.get("region"),
+        address_data.get("postal_code"),
+        address_data.get("country"),
+    ]
+    return ", ".join(part for part in parts if part)
+
+
+def join_list(values: list[str] | None) -> str | None:
+    """Join a list of strings, None when empty."""
+    if not values or not isinstance(values, list):
+        return None
+    return ", ".join(values)
+
+
+def intern_string(value: Any) -> Any:
+    """Intern a code shared by many companies, so it is kept once."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyRecord:
+    """Typed values of one company profile, indexed by entities.
+
+    The raw profile is dropped once parsed, this is all that is kept of it.
+    """
+
+    company_name: str | None = None
+    company_status: str | None = None
+    company_type: str | None = None
+    jurisdiction: str | None = None
+    date_of_creation: date | None = None
+    registered_office_address: str | None = None
+    sic_codes: str | None = None
+    accounts_next_due: date | None = None
+    accounts_overdue: bool | None = None
+    last_accounts_type: str | None = None
+    last_accounts_period_end: date | None = None
+    next_accounts_period_start: date | None = None
+    next_accounts_period_end: date | None = None
+    confirmation_statement_next_due: date | None = None
+    confirmation_statement_last_made: date | None = None
+    confirmation_statement_overdue: bool | None = None
+    has_insolvency_history: bool | None = None
+    can_file: bool | None = None
+    registered_office_is_in_dispute: bool | None = None
+    undeliverable_registered_office_address: bool | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CompanyRecord:
+        """Create a record from its stored form."""
+        return cls(
+            *(
+                convert(data.get(name)) if convert is not None else data.get(name)
+                for name, convert in _STORED_FIELDS
+            )
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record in a serializable form, without empty values."""
+        data: dict[str, Any] = {}
+        for name, _ in _STORED_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, date):
+                value = value.isoformat()
+            if value is not None:
+                data[name] = value
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSpec:
+    """Where a record field is found in the profile and how it is converted."""
+
+    name: str
+    path: tuple[str, ...]
+    convert: Callable[[Any], Any] | None = None
+
+
+FIELDS: tuple[FieldSpec, ...] = (
+    FieldSpec("company_name", ("company_name",)),
+    FieldSpec("company_status", ("company_status",), intern_string),
+    FieldSpec("company_type", ("type",), intern_string),
+    FieldSpec("jurisdiction", ("jurisdiction",), intern_string),
+    FieldSpec("date_of_creation", ("date_of_creation",), parse_date),
+    FieldSpec(
+        "registered_office_address", ("registered_office_address",), format_address
+    ),
+    FieldSpec("sic_codes", ("sic_codes",), join_list),
+    FieldSpec("accounts_next_due", ("accounts", "next_accounts", "due_on"), parse_date),
+    FieldSpec("accounts_overdue", ("accounts", "next_accounts", "overdue")),
+    FieldSpec(
+        "last_accounts_type", ("accounts", "last_accounts", "type"), intern_string
+    ),
+    FieldSpec(
+        "last_accounts_period_end",
+        ("accounts", "last_accounts", "period_end_on"),
+        parse_date,
+    ),
+    FieldSpec(
+        "next_accounts_period_start",
+        ("accounts", "next_accounts", "period_start_on"),
+        parse_date,
+    ),
+    FieldSpec(
+        "next_accounts_period_end",
+        ("accounts", "next_accounts", "period_end_on"),
+        parse_date,
+    ),
+    FieldSpec(
+        "confirmation_statement_next_due",
+        ("confirmation_statement", "next_due"),
+        parse_date,
+    ),
+    FieldSpec(
+        "confirmation_statement_last_made",
+        ("confirmation_statement", "last_made_up_to"),
+        parse_date,
+    ),
+    FieldSpec("confirmation_statement_overdue", ("confirmation_statement", "overdue")),
+    FieldSpec("has_insolvency_history", ("has_insolvency_history",)),
+    FieldSpec("can_file", ("can_file",)),
+    FieldSpec("registered_office_is_in_dispute", ("registered_office_is_in_dispute",)),
+    FieldSpec(
+        "undeliverable_registered_office_address",
+        ("undeliverable_registered_office_address",),
+    ),
+)
+
+RECORD_FIELDS: frozenset[str] = frozenset(f.name for f in fields(CompanyRecord))
+
+# stored dates are strings and codes are interned again, the rest is kept
+_STORED_CONVERSIONS = {
+    spec.name: spec.convert
+    for spec in FIELDS
+    if spec.convert in (parse_date, intern_string)
+}
+# record fields in order, with the conversion of their stored value
+_STORED_FIELDS: tuple[tuple[str, Callable[[Any], Any] | None], ...] = tuple(
+    (f.name, _STORED_CONVERSIONS.get(f.name)) for f in fields(CompanyRecord)
+)
+
+
+@dataclass(slots=True)
+class _PlanNode:
+    """Profile key with the record slots it fills and the keys below it."""
+
+    leaves: list[tuple[int, Callable[[Any], Any] | None]] = field(default_factory=list)
+    children: dict[str, _PlanNode] = field(default_factory=dict)
+
+
+def _compile_plan(specs: tuple[FieldSpec, ...]) -> dict[str, _PlanNode]:
+    """Merge the field paths into a tree so shared prefixes are read once."""
+    slots = {f.name: index for index, f in enumerate(fields(CompanyRecord))}
+    plan: dict[str, _PlanNode] = {}
+    for spec in specs:
+        nodes = plan
+        for key in spec.path[:-1]:
+            nodes = nodes.setdefault(key, _PlanNode()).children
+        nodes.setdefault(spec.path[-1], _PlanNode()).leaves.append(
+            (slots[spec.name], spec.convert)
+        )
+    return plan
+
+
+_PLAN = _compile_plan(FIELDS)
+_EMPTY = [None] * len(RECORD_FIELDS)
+
+
+def _walk(nodes: dict[str, _PlanNode], data: dict, values: list[Any]) -> None:
+    for key, node in nodes.items():
+        value = data.get(key)
+        if value is None:
+            continue
+        for index, convert in node.leaves:
+            values[index] = value if convert is None else convert(value)
+        if node.children and isinstance(value, dict):
+            _walk(node.children, value, values)
+
+
+def extract_record(profile: dict[str, Any]) -> CompanyRecord:
+    """Walk a profile once and return the values of every field."""
+    values = _EMPTY.copy()
+    _walk(_PLAN, profile, values)
+    return CompanyRecord(*values)
+
+
+def merge_record(record: CompanyRecord, update: dict[str, Any]) -> CompanyRecord:
+    """Return a record with the values of a partial profile merged over it.
+
+    Fields the update does not carry keep their value.
+    """
+    values = [getattr(record, name) for name, _ in _STORED_FIELDS]
+    _walk(_PLAN, update, values)
+    return CompanyRecord(*values)
@@ -0,0 +1,133 @@
+"""Shared rate limiting for API keys."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    _LOGGER,
+    DATA_RATE_LIMITERS,
+    DOMAIN,
+    RATE_LIMIT_REQUESTS,
+    RATE_LIMIT_WINDOW,
+)
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class CompaniesHouseRateLimiter:
+    """Token bucket shared by every client using the same API key."""
+
+    def __init__(
+        self,
+        capacity: int = RATE_LIMIT_REQUESTS,
+        window: float = RATE_LIMIT_WINDOW,
+    ) -> None:
+        """Create a full bucket refilling `capacity` tokens per `window` seconds."""
+        self._capacity = capacity
+        self._refill_rate = capacity / window
+        self._tokens = float(capacity)
+        self._refilled_at = time.monotonic()
+        # set when the API reports an exhausted window or answers 429
+        self._blocked_until = 0.0
+        # waiters are served in FIFO order by the lock
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+
+        self.remaining: int | None = None
+        self.reset_at: int | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return self._waiting
+
+    @property
+    def wait_time(self) -> float:
+        """Return the estimated seconds until the queue is drained."""
+        now = time.monotonic()
+        self._refill(now)
+        needed = self._waiting + 1 - self._tokens
+        wait = needed / self._refill_rate if needed > 0 else 0.0
+        return max(wait, self._blocked_until - now)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(
+                self._capacity, self._tokens + elapsed * self._refill_rate
+            )
+            self._refilled_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        self._waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = self._blocked_until - now
+                    if delay <= 0 and self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    if delay <= 0:
+                        delay = (1 - self._tokens) / self._refill_rate
+                    _LOGGER.debug(
+                        "Rate limit reached, waiting %.1fs (%d queued)",
+                        delay,
+                        self._waiting,
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            self._waiting -= 1
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Align the bucket with the X-Ratelimit-* headers of a response."""
+        remaining = _header_int(headers, "X-Ratelimit-Remaining")
+        reset_at = _header_int(headers, "X-Ratelimit-Reset")
+        if remaining is None:
+            return
+
+        self.remaining = remaining
+        self.reset_at = reset_at
+        # the server is authoritative, never believe we have more than it says
+        self._tokens = min(self._tokens, float(remaining))
+        if remaining <= 0 and reset_at is not None:
+            self._block(reset_at - time.time())
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Drain the bucket after the API answered 429 Too Many Requests."""
+        self._tokens = 0.0
+        if retry_after is None and self.reset_at is not None:
+            retry_after = self.reset_at - time.time()
+        self._block(retry_after if retry_after is not None else 1 / self._refill_rate)
+
+    def _block(self, seconds: float) -> None:
+        self._blocked_until = max(
+            self._blocked_until, time.monotonic() + max(seconds, 0.0)
+        )
+
+
+def async_get_rate_limiter(
+    hass: HomeAssistant, api_key: str
+) -> CompaniesHouseRateLimiter:
+    """Return the rate limiter shared by all clients of an API key."""
+    limiters: dict[str, CompaniesHouseRateLimiter] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_RATE_LIMITERS, {})
+    if (limiter := limiters.get(api_key)) is None:
+        limiter = limiters[api_key] = CompaniesHouseRateLimiter()
+    return limiter
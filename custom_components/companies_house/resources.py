@@ -0,0 +1,91 @@
+"""Officers, persons with significant control and charges of a company."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from .api import CompaniesHouseApiClient
+
+# names kept as an attribute, the rest is only counted
+MAX_NAMES = 20
+
+OFFICERS = "officers"
+PERSONS_WITH_SIGNIFICANT_CONTROL = "persons_with_significant_control"
+CHARGES = "charges"
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceSummary:
+    """Counts and names of the items of a resource."""
+
+    active: int
+    total: int
+    names: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceSpec:
+    """How to fetch and summarize a resource, and how often."""
+
+    key: str
+    interval: timedelta
+    fetch: Callable[[CompaniesHouseApiClient, str], AsyncIterator[dict]]
+    is_active: Callable[[dict], bool]
+    describe: Callable[[dict], str | None]
+
+    async def async_summarize(
+        self, api_client: CompaniesHouseApiClient, company_number: str
+    ) -> ResourceSummary:
+        """Fetch every page and summarize the items."""
+        active = total = 0
+        names: list[str] = []
+        async for item in self.fetch(api_client, company_number):
+            total += 1
+            if not self.is_active(item):
+                continue
+            active += 1
+            if len(names) < MAX_NAMES and (name := self.describe(item)):
+                names.append(name)
+        return ResourceSummary(active, total, tuple(names))
+
+
+def _describe_charge(item: dict) -> str | None:
+    persons = ", ".join(
+        person["name"]
+        for person in item.get("persons_entitled", [])
+        if "name" in person
+    )
+    description = item.get("classification", {}).get("description")
+    return " - ".join(text for text in (description, persons) if text) or None
+
+
+RESOURCES: dict[str, ResourceSpec] = {
+    spec.key: spec
+    for spec in (
+        ResourceSpec(
+            key=OFFICERS,
+            interval=timedelta(days=1),
+            fetch=CompaniesHouseApiClient.iter_officers,
+            is_active=lambda item: "resigned_on" not in item,
+            describe=lambda item: item.get("name"),
+        ),
+        ResourceSpec(
+            key=PERSONS_WITH_SIGNIFICANT_CONTROL,
+            interval=timedelta(days=1),
+            fetch=CompaniesHouseApiClient.iter_persons_with_significant_control,
+            is_active=lambda item: "ceased_on" not in item and not item.get("ceased"),
+            describe=lambda item: item.get("name"),
+        ),
+        ResourceSpec(
+            key=CHARGES,
+            interval=timedelta(weeks=1),
+            fetch=CompaniesHouseApiClient.iter_charges,
+            is_active=lambda item: (
+                item.get("status") in ("outstanding", "part-satisfied")
+            ),
+            describe=_describe_charge,
+        ),
+    )
+}
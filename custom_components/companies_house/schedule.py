@@ -0,0 +1,120 @@
+"""Adaptive polling schedule driven by filing deadlines."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, timedelta
+import hashlib
+from typing import Any
+
+from .profile import CompanyRecord
+
+# near a deadline, overdue or insolvent: poll at least this often
+URGENT_INTERVAL = timedelta(hours=1)
+URGENT_DAYS = 7
+SOON_INTERVAL = timedelta(hours=6)
+SOON_DAYS = 30
+
+# nothing is going to happen: poll at most this often
+DORMANT_INTERVAL = timedelta(days=1)
+CLOSED_INTERVAL = timedelta(weeks=1)
+
+INSOLVENCY_STATUSES = frozenset(
+    {
+        "administration",
+        "insolvency-proceedings",
+        "liquidation",
+        "receivership",
+        "voluntary-arrangement",
+    }
+)
+CLOSED_STATUSES = frozenset({"closed", "converted-closed", "dissolved", "removed"})
+
+
+def next_deadline(record: CompanyRecord) -> date | None:
+    """Return the earliest accounts or confirmation statement due date."""
+    deadlines = [
+        deadline
+        for deadline in (
+            record.accounts_next_due,
+            record.confirmation_statement_next_due,
+        )
+        if deadline is not None
+    ]
+    return min(deadlines, default=None)
+
+
+def poll_interval(record: CompanyRecord, base: timedelta, today: date) -> timedelta:
+    """Return how long to wait before polling a company again.
+
+    The configured interval is shortened for companies that are overdue,
+    insolvent or close to a deadline, and lengthened for dissolved and
+    dormant companies.
+    """
+    if record.company_status in CLOSED_STATUSES:
+        return max(base, CLOSED_INTERVAL)
+
+    if (
+        record.accounts_overdue
+        or record.confirmation_statement_overdue
+        or record.company_status in INSOLVENCY_STATUSES
+    ):
+        return min(base, URGENT_INTERVAL)
+
+    if (deadline := next_deadline(record)) is not None:
+        days_left = (deadline - today).days
+        if days_left <= URGENT_DAYS:
+            return min(base, URGENT_INTERVAL)
+        if days_left <= SOON_DAYS:
+            return min(base, SOON_INTERVAL)
+
+    if record.last_accounts_type == "dormant":
+        return max(base, DORMANT_INTERVAL)
+
+    return base
+
+
+def phase(company_number: str) -> float:
+    """Return the fraction of any interval at which a company is polled.
+
+    It comes from a hash of the company number, so companies spread evenly
+    over their interval and keep their place across restarts.
+    """
+    digest = hashlib.blake2b(company_number.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+def next_slot(after: float, interval: float, offset: float) -> float:
+    """Return the first unix time from after on the phase of an interval."""
+    return after + (offset * interval - after) % interval
+
+
+def schedule_report(
+    polls: Mapping[str, tuple[float, float]],
+    now: float,
+    horizon: float,
+    bucket: float,
+) -> dict[str, Any]:
+    """Return how many requests are planned in every bucket of the horizon.
+
+    polls maps a company number to its next poll and interval in seconds.
+    """
+    counts = [0] * max(1, int(-(-horizon // bucket)))
+    for next_poll, interval in polls.values():
+        poll = max(next_poll, now)
+        while poll < now + horizon:
+            counts[int((poll - now) // bucket)] += 1
+            poll += interval
+    total = sum(counts)
+    mean = total / len(counts)
+    return {
+        "companies": len(polls),
+        "horizon": horizon,
+        "bucket": bucket,
+        "requests": total,
+        "max_per_bucket": max(counts),
+        "mean_per_bucket": mean,
+        # 1.0 is a perfectly flat request rate
+        "peak_to_mean": max(counts) / mean if total else None,
+        "buckets": counts,
+    }
@@ -0,0 +1,163 @@
+"""Company search with a cache of recent queries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .api import CompaniesHouseApiClient
+from .const import DATA_SEARCH_CACHES, DOMAIN
+
+# results requested per search, a shorter answer holds every match
+SEARCH_PAGE_SIZE = 20
+SEARCH_CACHE_SIZE = 128
+SEARCH_CACHE_TTL = 300
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """A company found by a search."""
+
+    company_number: str
+    title: str
+    company_status: str | None
+    address_snippet: str | None
+
+    @property
+    def label(self) -> str:
+        """Return the text shown in the config flow."""
+        details = ", ".join(
+            part for part in (self.company_status, self.address_snippet) if part
+        )
+        label = f"{self.title} ({self.company_number})"
+        return f"{label} - {details}" if details else label
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedSearch:
+    results: tuple[SearchResult, ...]
+    # every match is in the results, so longer queries can be filtered locally
+    complete: bool
+    expires_at: float
+
+
+def normalize_query(query: str) -> str:
+    """Return the query as cached: case folded, single spaced."""
+    return " ".join(query.casefold().split())
+
+
+def _matches(result: SearchResult, words: list[str]) -> bool:
+    """Return if every word starts a word of the company name."""
+    title_words = result.title.casefold().split()
+    return all(
+        any(title_word.startswith(word) for title_word in title_words) for word in words
+    )
+
+
+class CompaniesHouseSearchCache:
+    """Least recently used cache of search results, expiring after a TTL.
+
+    A query adding words to a cached query whose results were complete is
+    answered from them, so refining a search costs no request. Identical
+    queries in flight share one request. Results depend on the API key, so
+    every key has its own cache.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: CompaniesHouseApiClient,
+        max_size: int = SEARCH_CACHE_SIZE,
+        ttl: float = SEARCH_CACHE_TTL,
+    ) -> None:
+        """Create an empty cache of the searches of an API client."""
+        self._hass = hass
+        self._api_client = api_client
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, _CachedSearch] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[_CachedSearch]] = {}
+
+    def _get(self, query: str) -> _CachedSearch | None:
+        if (entry := self._entries.get(query)) is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[query]
+            return None
+        self._entries.move_to_end(query)
+        return entry
+
+    def _put(self, query: str, entry: _CachedSearch) -> None:
+        self._entries[query] = entry
+        self._entries.move_to_end(query)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def lookup(self, query: str) -> tuple[SearchResult, ...] | None:
+        """Return cached results of a normalized query, if any."""
+        if (entry := self._get(query)) is not None:
+            return entry.results
+        words = query.split()
+        # the longest cached leading words are the narrowest result set
+        for count in range(len(words) - 1, 0, -1):
+            entry = self._get(" ".join(words[:count]))
+            if entry is None or not entry.complete:
+                continue
+            results = tuple(
+                result for result in entry.results if _matches(result, words)
+            )
+            # the API matches more loosely, ask it rather than show nothing
+            return results or None
+        return None
+
+    async def async_search(self, query: str) -> tuple[SearchResult, ...]:
+        """Return the companies matching a query."""
+        query = normalize_query(query)
+        if not query:
+            return ()
+        if (results := self.lookup(query)) is not None:
+            return results
+
+        if (task := self._in_flight.get(query)) is None:
+            task = self._in_flight[query] = self._hass.async_create_background_task(
+                self._async_fetch(query), f"{DOMAIN} search {query}"
+            )
+            task.add_done_callback(lambda _: self._in_flight.pop(query, None))
+        entry = await asyncio.shield(task)
+        self._put(query, entry)
+        return entry.results
+
+    async def _async_fetch(self, query: str) -> _CachedSearch:
+        response = await self._api_client.search_companies(query, SEARCH_PAGE_SIZE)
+        items = response.get("items") or []
+        results = tuple(
+            SearchResult(
+                company_number=item["company_number"],
+                title=item.get("title") or item["company_number"],
+                company_status=item.get("company_status"),
+                address_snippet=item.get("address_snippet"),
+            )
+            for item in items
+            if item.get("company_number")
+        )
+        return _CachedSearch(
+            results,
+            complete=response.get("total_results", len(items)) <= len(items),
+            expires_at=time.monotonic() + self._ttl,
+        )
+
+
+def async_get_search_cache(
+    hass: HomeAssistant, api_client: CompaniesHouseApiClient
+) -> CompaniesHouseSearchCache:
+    """Return the search cache shared by all config flows of an API key."""
+    caches: dict[str, CompaniesHouseSearchCache] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_SEARCH_CACHES, {})
+    if (cache := caches.get(api_client.key_id)) is None:
+        cache = caches[api_client.key_id] = CompaniesHouseSearchCache(hass, api_client)
+    return cache
@@ -11,57 +11,111 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
 
+from .const import (
+    CONF_COMPANY_NUMBER,
+    ENTITY_GROUP_CONTROL,
+    ENTITY_GROUP_DEADLINES,
+    ENTITY_GROUP_DETAILS,
+    ENTITY_GROUP_FILINGS,
+    ENTITY_GROUP_STATUS,
+)
 from .coordinator import CompaniesHouseDataUpdateCoordinator
-from .entity import CompaniesHouseEntity
+from .entity import (
+    CompaniesHouseEntity,
+    CompaniesHouseEntityDescription,
+    CompaniesHouseHubEntity,
+    CompaniesHouseOnDemandEntity,
+    async_company_descriptions,
+    async_is_disabled,
+    hub_unique_id,
+)
+from .filings import Filing
+from .portfolio import CompaniesHousePortfolio
+from .resources import (
+    CHARGES,
+    OFFICERS,
+    PERSONS_WITH_SIGNIFICANT_CONTROL,
+    ResourceSummary,
+)
 
 
-def _parse_ch_date(date_str: str | None) -> date | None:
-    if not date_str:
-        return None
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
-    except ValueError:
-        return None
+@dataclass(frozen=True, kw_only=True)
+class CompaniesHouseSensorEntityDescription(
+    SensorEntityDescription, CompaniesHouseEntityDescription
+):
+    """Sensor entity description class."""
 
+    field: str
 
-def safe_get(data: dict, *keys: str) -> Any | None:
-    """Safely get nested dictionary values."""
-    current = data
-    for key in keys:
-        if not isinstance(current, dict):
-            return None
-        current = current.get(key)
-    return current
 
+@dataclass(frozen=True, kw_only=True)
+class CompaniesHouseResourceSensorEntityDescription(
+    SensorEntityDescription, CompaniesHouseEntityDescription
+):
+    """Sensor entity description class of a separately fetched resource."""
+
+    resource: str
 
-def format_address(address_data: dict | None) -> str | None:
-    """Format an address dictionary into a string."""
-    if not address_data:
-        return None
 
-    parts = [
-        address_data.get("premises"),
-        address_data.get("address_line_1"),
-        address_data.get("address_line_2"),
-        address_data.get("locality"),
-        address_data.get("region"),
-        address_data.get("postal_code"),
-        address_data.get("country"),
-    ]
-    return ", ".join(part for part in parts if part)
+@dataclass(frozen=True, kw_only=True)
+class CompaniesHouseFilingSensorEntityDescription(
+    SensorEntityDescription, CompaniesHouseEntityDescription
+):
+    """Sensor entity description class of the filing history."""
 
 
 @dataclass(frozen=True, kw_only=True)
-class CompaniesHouseSensorEntityDescription(SensorEntityDescription):
-    """Sensor entity description class."""
+class CompaniesHouseMetricSensorEntityDescription(SensorEntityDescription):
+    """Sensor entity description class of a hub metric."""
+
+    value_fn: Callable[[CompaniesHouseDataUpdateCoordinator], StateType | datetime]
+
 
-    value_fn: Callable[[dict[str, Any]], StateType | date]
+@dataclass(frozen=True, kw_only=True)
+class CompaniesHousePortfolioSensorEntityDescription(SensorEntityDescription):
+    """Sensor entity description class of an aggregate of every company."""
+
+    value_fn: Callable[[CompaniesHousePortfolio], StateType | date]
+    attributes_fn: Callable[[CompaniesHousePortfolio], dict[str, Any]] | None = None
+
+
+def _percentage(ratio: float | None) -> float | None:
+    return round(ratio * 100, 1) if ratio is not None else None
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+def _last_success(coordinator: CompaniesHouseDataUpdateCoordinator) -> datetime | None:
+    stats = coordinator.api_client.metrics.refreshes.get(coordinator.name)
+    if stats is None or stats.last_success is None:
+        return None
+    return dt_util.utc_from_timestamp(stats.last_success)
+
+
+def _last_refresh_duration(
+    coordinator: CompaniesHouseDataUpdateCoordinator,
+) -> float | None:
+    stats = coordinator.api_client.metrics.refreshes.get(coordinator.name)
+    if stats is None or stats.last_duration is None:
+        return None
+    return round(stats.last_duration, 2)
 
 
 STATUS_OPTIONS = [
@@ -86,100 +140,295 @@ SENSOR_TYPES: tuple[CompaniesHouseSensorEntityDescription, ...] = (
         icon="mdi:domain",
         device_class=SensorDeviceClass.ENUM,
         options=STATUS_OPTIONS,
-        value_fn=lambda data: data.get("company_status"),
+        field="company_status",
+        group=ENTITY_GROUP_STATUS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="date_of_creation",
         translation_key="date_of_creation",
         icon="mdi:calendar-star",
         device_class=SensorDeviceClass.DATE,
-        value_fn=lambda data: _parse_ch_date(data.get("date_of_creation")),
+        field="date_of_creation",
+        group=ENTITY_GROUP_DETAILS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="accounts_next_due",
         translation_key="accounts_next_due",
         icon="mdi:calendar-clock",
         device_class=SensorDeviceClass.DATE,
-        value_fn=lambda data: _parse_ch_date(
-            safe_get(data, "accounts", "next_accounts", "due_on")
-        ),
+        field="accounts_next_due",
+        group=ENTITY_GROUP_DEADLINES,
     ),
     CompaniesHouseSensorEntityDescription(
         key="last_accounts_type",
         translation_key="last_accounts_type",
         icon="mdi:file-percent",
-        value_fn=lambda data: safe_get(data, "accounts", "last_accounts", "type"),
+        field="last_accounts_type",
+        group=ENTITY_GROUP_DETAILS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="confirmation_statement_next_due",
         translation_key="confirmation_statement_next_due",
         icon="mdi:calendar-clock",
         device_class=SensorDeviceClass.DATE,
-        value_fn=lambda data: _parse_ch_date(
-            safe_get(data, "confirmation_statement", "next_due")
-        ),
+        field="confirmation_statement_next_due",
+        group=ENTITY_GROUP_DEADLINES,
     ),
     CompaniesHouseSensorEntityDescription(
         key="company_type",
         translation_key="company_type",
         icon="mdi:briefcase-variant",
-        value_fn=lambda data: data.get("type"),
+        field="company_type",
+        group=ENTITY_GROUP_DETAILS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="jurisdiction",
         translation_key="jurisdiction",
         icon="mdi:map-marker-radius",
-        value_fn=lambda data: data.get("jurisdiction"),
+        field="jurisdiction",
+        group=ENTITY_GROUP_DETAILS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="registered_office_address",
         translation_key="registered_office_address",
         icon="mdi:map-marker",
-        value_fn=lambda data: format_address(data.get("registered_office_address")),
+        field="registered_office_address",
+        group=ENTITY_GROUP_DETAILS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="sic_codes",
         translation_key="sic_codes",
         icon="mdi:tag-multiple",
-        value_fn=lambda data: ", ".join(data.get("sic_codes", []))
-        if data.get("sic_codes")
-        else None,
+        field="sic_codes",
+        group=ENTITY_GROUP_DETAILS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="last_accounts_period_end",
         translation_key="last_accounts_period_end",
         icon="mdi:calendar-arrow-left",
         device_class=SensorDeviceClass.DATE,
-        value_fn=lambda data: _parse_ch_date(
-            safe_get(data, "accounts", "last_accounts", "period_end_on")
-        ),
+        field="last_accounts_period_end",
+        group=ENTITY_GROUP_DETAILS,
     ),
     CompaniesHouseSensorEntityDescription(
         key="next_accounts_period_start",
         translation_key="next_accounts_period_start",
         icon="mdi:calendar-start",
         device_class=SensorDeviceClass.DATE,
-        value_fn=lambda data: _parse_ch_date(
-            safe_get(data, "accounts", "next_accounts", "period_start_on")
-        ),
+        field="next_accounts_period_start",
+        group=ENTITY_GROUP_DEADLINES,
     ),
     CompaniesHouseSensorEntityDescription(
         key="next_accounts_period_end",
         translation_key="next_accounts_period_end",
         icon="mdi:calendar-end",
         device_class=SensorDeviceClass.DATE,
-        value_fn=lambda data: _parse_ch_date(
-            safe_get(data, "accounts", "next_accounts", "period_end_on")
-        ),
+        field="next_accounts_period_end",
+        group=ENTITY_GROUP_DEADLINES,
     ),
     CompaniesHouseSensorEntityDescription(
         key="confirmation_statement_last_made",
         translation_key="confirmation_statement_last_made",
         icon="mdi:file-document-check",
         device_class=SensorDeviceClass.DATE,
-        value_fn=lambda data: _parse_ch_date(
-            safe_get(data, "confirmation_statement", "last_made_up_to")
+        field="confirmation_statement_last_made",
+        group=ENTITY_GROUP_DETAILS,
+    ),
+)
+
+# disabled by default, each one enabled costs a request per company and cadence
+RESOURCE_SENSOR_TYPES: tuple[CompaniesHouseResourceSensorEntityDescription, ...] = (
+    CompaniesHouseResourceSensorEntityDescription(
+        key="officers",
+        translation_key="officers",
+        icon="mdi:account-tie",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        resource=OFFICERS,
+        group=ENTITY_GROUP_CONTROL,
+    ),
+    CompaniesHouseResourceSensorEntityDescription(
+        key="persons_with_significant_control",
+        translation_key="persons_with_significant_control",
+        icon="mdi:account-key",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        resource=PERSONS_WITH_SIGNIFICANT_CONTROL,
+        group=ENTITY_GROUP_CONTROL,
+    ),
+    CompaniesHouseResourceSensorEntityDescription(
+        key="charges_outstanding",
+        translation_key="charges_outstanding",
+        icon="mdi:bank",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        resource=CHARGES,
+        group=ENTITY_GROUP_CONTROL,
+    ),
+)
+
+
+FILING_SENSOR_TYPES: tuple[CompaniesHouseFilingSensorEntityDescription, ...] = (
+    CompaniesHouseFilingSensorEntityDescription(
+        key="latest_filing",
+        translation_key="latest_filing",
+        icon="mdi:file-document-arrow-right",
+        device_class=SensorDeviceClass.DATE,
+        group=ENTITY_GROUP_FILINGS,
+    ),
+)
+
+
+# deadlines listed by the next deadline sensor
+UPCOMING_DEADLINES = 10
+
+
+def _next_deadline_attributes(portfolio: CompaniesHousePortfolio) -> dict[str, Any]:
+    if (deadline := portfolio.next_deadline) is None:
+        return {}
+    return {
+        "company_number": deadline.company_number,
+        "company_name": portfolio.company_name(deadline.company_number),
+        "kind": deadline.kind,
+        "upcoming": [
+            {
+                "due": upcoming.due.isoformat(),
+                "company_number": upcoming.company_number,
+                "kind": upcoming.kind,
+            }
+            for upcoming in portfolio.upcoming(UPCOMING_DEADLINES)
+        ],
+    }
+
+
+PORTFOLIO_SENSOR_TYPES: tuple[CompaniesHousePortfolioSensorEntityDescription, ...] = (
+    CompaniesHousePortfolioSensorEntityDescription(
+        key="companies",
+        translation_key="companies",
+        icon="mdi:domain",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=len,
+        # the number of companies of every status
+        attributes_fn=lambda portfolio: dict(portfolio.statuses),
+    ),
+    CompaniesHousePortfolioSensorEntityDescription(
+        key="companies_accounts_overdue",
+        translation_key="companies_accounts_overdue",
+        icon="mdi:file-alert-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda portfolio: portfolio.accounts_overdue,
+    ),
+    CompaniesHousePortfolioSensorEntityDescription(
+        key="companies_confirmation_statement_overdue",
+        translation_key="companies_confirmation_statement_overdue",
+        icon="mdi:file-alert-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda portfolio: portfolio.confirmation_statement_overdue,
+    ),
+    CompaniesHousePortfolioSensorEntityDescription(
+        key="next_deadline",
+        translation_key="next_deadline",
+        device_class=SensorDeviceClass.DATE,
+        value_fn=lambda portfolio: (
+            deadline.due if (deadline := portfolio.next_deadline) else None
         ),
+        attributes_fn=_next_deadline_attributes,
+    ),
+)
+
+
+# disabled by default, they describe the integration rather than the companies
+METRIC_SENSOR_TYPES: tuple[CompaniesHouseMetricSensorEntityDescription, ...] = (
+    CompaniesHouseMetricSensorEntityDescription(
+        key="api_requests",
+        translation_key="api_requests",
+        icon="mdi:swap-vertical",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.api_client.metrics.requests,
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="api_bytes_received",
+        translation_key="api_bytes_received",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.KILOBYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.api_client.metrics.bytes_received,
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="api_retries",
+        translation_key="api_retries",
+        icon="mdi:refresh",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.api_client.metrics.retries,
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="api_errors",
+        translation_key="api_errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.api_client.metrics.errors.total(),
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="api_latency_mean",
+        translation_key="api_latency_mean",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.api_client.metrics.request_latency.mean
+        ),
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="api_latency_p95",
+        translation_key="api_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _milliseconds(
+            coordinator.api_client.metrics.request_latency.quantile(0.95)
+        ),
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="cache_hit_ratio",
+        translation_key="cache_hit_ratio",
+        icon="mdi:cached",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _percentage(
+            coordinator.api_client.metrics.cache_hit_ratio
+        ),
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="not_modified_rate",
+        translation_key="not_modified_rate",
+        icon="mdi:file-check-outline",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _percentage(
+            coordinator.api_client.metrics.not_modified_rate
+        ),
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="rate_limit_remaining",
+        translation_key="rate_limit_remaining",
+        icon="mdi:speedometer",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.api_client.rate_limiter.remaining,
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="last_successful_refresh",
+        translation_key="last_successful_refresh",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=_last_success,
+    ),
+    CompaniesHouseMetricSensorEntityDescription(
+        key="last_refresh_duration",
+        translation_key="last_refresh_duration",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_last_refresh_duration,
     ),
 )
 
@@ -191,10 +440,53 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensors from a config entry."""
     coordinator = entry.runtime_data
+    company_number = entry.data[CONF_COMPANY_NUMBER]
     async_add_entities(
-        CompaniesHouseSensor(coordinator, description) for description in SENSOR_TYPES
+        [
+            *(
+                CompaniesHouseSensor(coordinator, company_number, description)
+                for description in async_company_descriptions(
+                    hass, entry, Platform.SENSOR, SENSOR_TYPES
+                )
+            ),
+            *(
+                CompaniesHouseResourceSensor(coordinator, company_number, description)
+                for description in async_company_descriptions(
+                    hass, entry, Platform.SENSOR, RESOURCE_SENSOR_TYPES
+                )
+            ),
+            *(
+                CompaniesHouseFilingSensor(coordinator, company_number, description)
+                for description in async_company_descriptions(
+                    hass, entry, Platform.SENSOR, FILING_SENSOR_TYPES
+                )
+            ),
+        ]
     )
 
+    @callback
+    def _async_add_hub_entities() -> None:
+        async_add_entities(
+            [
+                *(
+                    CompaniesHousePortfolioSensor(coordinator, description)
+                    for description in PORTFOLIO_SENSOR_TYPES
+                ),
+                *(
+                    CompaniesHouseMetricSensor(coordinator, description)
+                    for description in METRIC_SENSOR_TYPES
+                    if not async_is_disabled(
+                        hass,
+                        Platform.SENSOR,
+                        hub_unique_id(coordinator, description.key),
+                    )
+                ),
+            ]
+        )
+
+    # the hub is shared by every entry of the API key, one entry holds it
+    coordinator.async_offer_hub_entities(entry.entry_id, _async_add_hub_entities)
+
 
 class CompaniesHouseSensor(CompaniesHouseEntity, SensorEntity):
     """Sensor entity class."""
@@ -204,7 +496,138 @@ class CompaniesHouseSensor(CompaniesHouseEntity, SensorEntity):
     def __init__(
         self,
         coordinator: CompaniesHouseDataUpdateCoordinator,
+        company_number: str,
         description: CompaniesHouseSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, company_number, description.key)
+        self.entity_description = description
+        self._update_value()
+
+    def _update_value(self) -> bool:
+        """Recompute the sensor value, return if it changed."""
+        value = getattr(self.company_record, self.entity_description.field)
+        if value == self._attr_native_value:
+            return False
+        self._attr_native_value = value
+        return True
+
+
+class CompaniesHouseResourceSensor(CompaniesHouseOnDemandEntity, SensorEntity):
+    """Sensor entity class of officers, persons with significant control, charges."""
+
+    entity_description: CompaniesHouseResourceSensorEntityDescription
+    _unrecorded_attributes = frozenset({"names"})
+
+    def __init__(
+        self,
+        coordinator: CompaniesHouseDataUpdateCoordinator,
+        company_number: str,
+        description: CompaniesHouseResourceSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._summary: ResourceSummary | None = None
+        super().__init__(
+            coordinator,
+            coordinator.async_get_resource_coordinator(description.resource),
+            company_number,
+            description.key,
+        )
+        self.entity_description = description
+        self._update_value()
+
+    def _update_value(self) -> bool:
+        """Recompute the sensor value, return if it changed."""
+        summary = self.source.data.get(self.company_number)
+        if summary == self._summary:
+            return False
+        self._summary = summary
+        if summary is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+        else:
+            self._attr_native_value = summary.active
+            self._attr_extra_state_attributes = {
+                "total": summary.total,
+                "names": list(summary.names),
+            }
+        return True
+
+
+class CompaniesHouseFilingSensor(CompaniesHouseOnDemandEntity, SensorEntity):
+    """Sensor entity class of the latest filing."""
+
+    entity_description: CompaniesHouseFilingSensorEntityDescription
+    _unrecorded_attributes = frozenset({"recent_filings"})
+
+    def __init__(
+        self,
+        coordinator: CompaniesHouseDataUpdateCoordinator,
+        company_number: str,
+        description: CompaniesHouseFilingSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._filings: tuple[Filing, ...] | None = None
+        super().__init__(
+            coordinator, coordinator.filing_coordinator, company_number, description.key
+        )
+        self.entity_description = description
+        self._update_value()
+
+    def _update_value(self) -> bool:
+        """Recompute the sensor value, return if it changed."""
+        filings = self.source.data.get(self.company_number)
+        if filings is self._filings:
+            return False
+        self._filings = filings
+        if not filings:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return True
+        latest = filings[0]
+        self._attr_native_value = latest.date
+        self._attr_extra_state_attributes = {
+            "transaction_id": latest.transaction_id,
+            "category": latest.category,
+            "type": latest.type,
+            "description": latest.description,
+            "recent_filings": [filing.as_dict() for filing in filings],
+        }
+        return True
+
+
+class CompaniesHouseMetricSensor(CompaniesHouseHubEntity, SensorEntity):
+    """Sensor entity class of a hub metric."""
+
+    entity_description: CompaniesHouseMetricSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: CompaniesHouseDataUpdateCoordinator,
+        description: CompaniesHouseMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self.coordinator)
+
+
+class CompaniesHousePortfolioSensor(CompaniesHouseHubEntity, SensorEntity):
+    """Sensor entity class of an aggregate of every company."""
+
+    entity_description: CompaniesHousePortfolioSensorEntityDescription
+    _unrecorded_attributes = frozenset({"upcoming"})
+
+    def __init__(
+        self,
+        coordinator: CompaniesHouseDataUpdateCoordinator,
+        description: CompaniesHousePortfolioSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, description.key)
@@ -212,5 +635,12 @@ class CompaniesHouseSensor(CompaniesHouseEntity, SensorEntity):
 
     @property
     def native_value(self) -> StateType | date:
-        """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        """Return the current value of the aggregate."""
+        return self.entity_description.value_fn(self.coordinator.portfolio)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the details of the aggregate."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self.coordinator.portfolio)
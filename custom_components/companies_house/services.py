@@ -0,0 +1,164 @@
+"""Services for the integration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .bulk import async_import_companies, parse_company_numbers
+from .const import (
+    CONF_API_KEY,
+    CONF_COMPANY_NUMBERS,
+    CONF_HORIZON,
+    CONF_PATH,
+    CONF_STREAM_KEY,
+    CONF_UPDATE_INTERVAL,
+    DATA_COORDINATORS,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    RATE_LIMIT_WINDOW,
+)
+from .coordinator import CompaniesHouseDataUpdateCoordinator
+from .snapshot import CompaniesHouseSnapshotSource, SnapshotFormatError
+
+SERVICE_IMPORT_COMPANIES = "import_companies"
+SERVICE_INGEST_SNAPSHOT = "ingest_snapshot"
+SERVICE_GET_SCHEDULE = "get_schedule"
+
+IMPORT_COMPANIES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_API_KEY): cv.string,
+        vol.Required(CONF_COMPANY_NUMBERS): vol.Any(
+            cv.string, vol.All(cv.ensure_list, [cv.string])
+        ),
+        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_STREAM_KEY): cv.string,
+    }
+)
+
+INGEST_SNAPSHOT_SCHEMA = vol.Schema({vol.Required(CONF_PATH): cv.string})
+
+GET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_HORIZON, default=24): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=24 * 7)
+        ),
+    }
+)
+
+
+async def _async_import_companies(call: ServiceCall) -> ServiceResponse:
+    """Validate a list or CSV of companies and add the valid ones."""
+    hass = call.hass
+    company_numbers = call.data[CONF_COMPANY_NUMBERS]
+    if isinstance(company_numbers, list):
+        company_numbers = "\n".join(company_numbers)
+    company_numbers = parse_company_numbers(company_numbers)
+    if not company_numbers:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="no_company_numbers"
+        )
+
+    if (api_key := call.data.get(CONF_API_KEY)) is None:
+        entries = hass.config_entries.async_entries(DOMAIN)
+        if not entries:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="api_key_required"
+            )
+        api_key = entries[0].data[CONF_API_KEY]
+
+    results = await async_import_companies(
+        hass,
+        api_key.strip(),
+        company_numbers,
+        call.data[CONF_UPDATE_INTERVAL],
+        call.data.get(CONF_STREAM_KEY),
+    )
+    return {"results": results}
+
+
+async def _async_ingest_snapshot(call: ServiceCall) -> ServiceResponse:
+    """Update the tracked companies from a Company data product snapshot."""
+    hass = call.hass
+    path = call.data[CONF_PATH]
+    if not hass.config.is_allowed_path(path):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="path_not_allowed",
+            translation_placeholders={"path": path},
+        )
+
+    coordinators: dict[str, CompaniesHouseDataUpdateCoordinator] = hass.data.get(
+        DOMAIN, {}
+    ).get(DATA_COORDINATORS, {})
+    tracked = {
+        number
+        for coordinator in coordinators.values()
+        for number in coordinator.company_numbers
+    }
+    try:
+        profiles = await hass.async_add_executor_job(
+            CompaniesHouseSnapshotSource(Path(path)).read_profiles, tracked
+        )
+    except (OSError, SnapshotFormatError) as err:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_snapshot",
+            translation_placeholders={"path": path, "error": str(err)},
+        ) from err
+    for coordinator in coordinators.values():
+        coordinator.async_push_profiles(profiles)
+
+    return {"updated": sorted(profiles), "missing": sorted(tracked - profiles.keys())}
+
+
+async def _async_get_schedule(call: ServiceCall) -> ServiceResponse:
+    """Return the requests planned per rate limit window, for every API key."""
+    coordinators: dict[str, CompaniesHouseDataUpdateCoordinator] = call.hass.data.get(
+        DOMAIN, {}
+    ).get(DATA_COORDINATORS, {})
+    return {
+        "schedules": {
+            coordinator.api_client.key_id: coordinator.async_get_schedule_reports(
+                call.data[CONF_HORIZON] * 3600, RATE_LIMIT_WINDOW
+            )
+            for coordinator in coordinators.values()
+        }
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_COMPANIES,
+        _async_import_companies,
+        schema=IMPORT_COMPANIES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_INGEST_SNAPSHOT,
+        _async_ingest_snapshot,
+        schema=INGEST_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SCHEDULE,
+        _async_get_schedule,
+        schema=GET_SCHEDULE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
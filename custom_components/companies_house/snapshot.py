@@ -0,0 +1,210 @@
+"""Company profiles from the Companies House bulk data product."""
+
+from __future__ import annotations
+
+from collections.abc import Container, Iterator
+import csv
+from datetime import datetime
+import io
+from pathlib import Path
+import re
+from typing import IO, Any
+import zipfile
+
+# CompanyStatus values of the data product -> company_status of the API
+_STATUSES = {
+    "active": "active",
+    "active - proposal to strike off": "active",
+    "live but receiver manager on at least one charge": "active",
+    "dissolved": "dissolved",
+    "liquidation": "liquidation",
+    "in administration": "administration",
+    "administration order": "administration",
+    "administrative receiver": "receivership",
+    "receiver action": "receivership",
+    "receivership": "receivership",
+    "voluntary arrangement": "voluntary-arrangement",
+    "insolvency proceedings": "insolvency-proceedings",
+    "converted / closed": "converted-closed",
+    "removed": "removed",
+    "closed": "closed",
+}
+
+# CompanyCategory values of the data product -> type of the API
+_TYPES = {
+    "private limited company": "ltd",
+    "public limited company": "plc",
+    "limited liability partnership": "llp",
+    "limited partnership": "limited-partnership",
+    "private unlimited company": "private-unlimited",
+    "private unlimited": "private-unlimited",
+    "community interest company": "ltd",
+    "charitable incorporated organisation": "charitable-incorporated-organisation",
+    "scottish charitable incorporated organisation": (
+        "scottish-charitable-incorporated-organisation"
+    ),
+    "registered society": "registered-society-non-jurisdictional",
+    "overseas entity": "registered-overseas-entity",
+    "pri/ltd by guar/nsc (private, limited by guarantee, no share capital)": (
+        "private-limited-guarant-nsc"
+    ),
+    "priv ltd sect. 30 (private limited company, section 30 of the companies act)": (
+        "private-limited-shares-section-30-exemption"
+    ),
+}
+
+_NOT_SET = {"", "none supplied", "no accounts filed"}
+
+
+class SnapshotFormatError(ValueError):
+    """The file is not a Company data product snapshot, str() says why."""
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+
+
+def _iso_date(value: str) -> str | None:
+    """Convert a DD/MM/YYYY date of the data product to YYYY-MM-DD."""
+    try:
+        return datetime.strptime(value, "%d/%m/%Y").date().isoformat()
+    except ValueError:
+        return None
+
+
+def _jurisdiction(company_number: str) -> str:
+    if company_number.startswith(("SC", "SO", "SL")):
+        return "scotland"
+    if company_number.startswith(("NI", "NC", "R0")):
+        return "northern-ireland"
+    return "england-wales"
+
+
+def _prune(data: dict[str, Any]) -> dict[str, Any]:
+    """Drop empty values, so merging never hides what the API returned."""
+    pruned: dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            value = _prune(value)
+        if value not in (None, "", [], {}):
+            pruned[key] = value
+    return pruned
+
+
+class CompaniesHouseSnapshotSource:
+    """Streaming reader of the free "Company data product" CSV snapshot.
+
+    The file (or the zip archive it is published as) is read one row at a
+    time, so memory use only depends on the number of tracked companies.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Create a reader for a .csv or .zip snapshot file."""
+        self._path = Path(path)
+
+    def _open(self) -> tuple[IO[str], zipfile.ZipFile | None]:
+        if self._path.suffix.lower() != ".zip":
+            return self._path.open(encoding="utf-8-sig", newline=""), None
+        try:
+            archive = zipfile.ZipFile(self._path)
+        except zipfile.BadZipFile as err:
+            raise SnapshotFormatError("not a valid zip archive") from err
+        member = next(
+            (name for name in archive.namelist() if name.lower().endswith(".csv")),
+            None,
+        )
+        if member is None:
+            archive.close()
+            raise SnapshotFormatError("no CSV file in the zip archive")
+        return (
+            io.TextIOWrapper(archive.open(member), encoding="utf-8-sig", newline=""),
+            archive,
+        )
+
+    def iter_profiles(
+        self, company_numbers: Container[str]
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (company number, profile) for the rows of tracked companies.
+
+        Blocking, run it in the executor. Raises SnapshotFormatError when the
+        file is not a snapshot.
+        """
+        stream, archive = self._open()
+        try:
+            reader = csv.reader(stream)
+            header = [column.strip() for column in next(reader, [])]
+            columns = {column: index for index, column in enumerate(header)}
+            if (number_column := columns.get("CompanyNumber")) is None:
+                raise SnapshotFormatError("no CompanyNumber column in the header")
+            for row in reader:
+                if len(row) <= number_column:
+                    continue
+                company_number = row[number_column].strip().upper()
+                if company_number not in company_numbers:
+                    continue
+                values = {
+                    column: row[index].strip()
+                    for column, index in columns.items()
+                    if index < len(row)
+                }
+                yield company_number, self._to_profile(company_number, values)
+        finally:
+            stream.close()
+            if archive is not None:
+                archive.close()
+
+    def read_profiles(self, company_numbers: Container[str]) -> dict[str, dict]:
+        """Return the profiles of the tracked companies found in the snapshot."""
+        return dict(self.iter_profiles(company_numbers))
+
+    @staticmethod
+    def _to_profile(company_number: str, row: dict[str, str]) -> dict[str, Any]:
+        """Map a data product row to the shape of the company profile API."""
+        status = row.get("CompanyStatus", "").lower()
+        category = row.get("CompanyCategory", "").lower()
+        accounts_type = row.get("Accounts.AccountCategory", "")
+        sic_codes = [
+            text.split(" - ", 1)[0].strip()
+            for index in range(1, 5)
+            if (text := row.get(f"SICCode.SicText_{index}", ""))
+            and text.lower() not in _NOT_SET
+        ]
+        last_made_up_to = _iso_date(row.get("Accounts.LastMadeUpDate", ""))
+
+        return _prune(
+            {
+                "company_number": company_number,
+                "company_name": row.get("CompanyName"),
+                "company_status": _STATUSES.get(status, _slug(status)),
+                "type": _TYPES.get(category, _slug(category)),
+                "jurisdiction": _jurisdiction(company_number),
+                "date_of_creation": _iso_date(row.get("IncorporationDate", "")),
+                "registered_office_address": {
+                    "care_of": row.get("RegAddress.CareOf"),
+                    "po_box": row.get("RegAddress.POBox"),
+                    "address_line_1": row.get("RegAddress.AddressLine1"),
+                    "address_line_2": row.get("RegAddress.AddressLine2"),
+                    "locality": row.get("RegAddress.PostTown"),
+                    "region": row.get("RegAddress.County"),
+                    "postal_code": row.get("RegAddress.PostCode"),
+                    "country": row.get("RegAddress.Country"),
+                },
+                "sic_codes": sic_codes,
+                "accounts": {
+                    "next_accounts": {
+                        "due_on": _iso_date(row.get("Accounts.NextDueDate", ""))
+                    },
+                    "last_accounts": {
+                        "made_up_to": last_made_up_to,
+                        "period_end_on": last_made_up_to,
+                        "type": None
+                        if accounts_type.lower() in _NOT_SET
+                        else _slug(accounts_type),
+                    },
+                },
+                "confirmation_statement": {
+                    "next_due": _iso_date(row.get("ConfStmtNextDueDate", "")),
+                    "last_made_up_to": _iso_date(row.get("ConfStmtLastMadeUpDate", "")),
+                },
+            }
+        )
@@ -0,0 +1,161 @@
+"""Persistent cache of company profiles and filings."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import time
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DATA_FILING_STORE, DATA_STORE, DOMAIN
+from .filings import Filing
+from .profile import CompanyRecord
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.profiles"
+FILINGS_STORAGE_KEY = f"{DOMAIN}.filings"
+SAVE_DELAY = 30
+
+
+class CompaniesHouseStore:
+    """Per company data saved across restarts."""
+
+    key: str
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the store (call async_load before use)."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, self.key
+        )
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        # company number -> {"t": fetched at (unix time), ...}
+        self._companies: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored data from disk once."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            if (stored := await self._store.async_load()) is not None:
+                self._companies = stored
+            self._loaded = True
+
+    @callback
+    def _async_set(self, company_number: str, **data: Any) -> None:
+        self._companies[company_number] = {"t": time.time(), **data}
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _async_touch(self, company_number: str, **data: Any) -> None:
+        if (snapshot := self._companies.get(company_number)) is None:
+            return
+        snapshot["t"] = time.time()
+        snapshot.update(data)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove(self, company_number: str) -> None:
+        """Forget a company."""
+        if self._companies.pop(company_number, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        return self._companies
+
+
+def _validators(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    validators = {"e": etag, "m": last_modified}
+    return {key: value for key, value in validators.items() if value is not None}
+
+
+class CompaniesHouseProfileStore(CompaniesHouseStore):
+    """Last good profile record of every company."""
+
+    key = STORAGE_KEY
+
+    def get(self, company_number: str) -> tuple[CompanyRecord, float] | None:
+        """Return the stored record of a company and when it was fetched."""
+        if (snapshot := self._companies.get(company_number)) is None:
+            return None
+        return CompanyRecord.from_dict(snapshot["r"]), snapshot["t"]
+
+    def get_validators(self, company_number: str) -> tuple[str | None, str | None]:
+        """Return the ETag and Last-Modified of the stored record of a company."""
+        snapshot = self._companies.get(company_number, {})
+        return snapshot.get("e"), snapshot.get("m")
+
+    @callback
+    def async_set(
+        self,
+        company_number: str,
+        record: CompanyRecord,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Remember a freshly fetched record and how to revalidate it."""
+        self._async_set(
+            company_number,
+            r=record.as_dict(),
+            **_validators(etag, last_modified),
+        )
+
+    @callback
+    def async_touch(
+        self,
+        company_number: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Remember that the stored record was fetched again, unchanged."""
+        self._async_touch(company_number, **_validators(etag, last_modified))
+
+
+class CompaniesHouseFilingStore(CompaniesHouseStore):
+    """Recent filings of every company, the newest one is the fetch cursor."""
+
+    key = FILINGS_STORAGE_KEY
+
+    def get(self, company_number: str) -> tuple[tuple[Filing, ...], float] | None:
+        """Return the stored filings of a company and when they were fetched."""
+        if (snapshot := self._companies.get(company_number)) is None:
+            return None
+        filings = tuple(Filing.from_dict(filing) for filing in snapshot["f"])
+        return filings, snapshot["t"]
+
+    @callback
+    def async_set(self, company_number: str, filings: Iterable[Filing]) -> None:
+        """Remember the filings of a company."""
+        self._async_set(company_number, f=[filing.as_dict() for filing in filings])
+
+    @callback
+    def async_touch(self, company_number: str) -> None:
+        """Remember that the filings were fetched again, without new ones."""
+        self._async_touch(company_number)
+
+
+_StoreT = TypeVar("_StoreT", bound=CompaniesHouseStore)
+
+
+async def _async_get_store(
+    hass: HomeAssistant, data_key: str, store_class: type[_StoreT]
+) -> _StoreT:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (store := domain_data.get(data_key)) is None:
+        store = domain_data[data_key] = store_class(hass)
+    await store.async_load()
+    return store
+
+
+async def async_get_profile_store(hass: HomeAssistant) -> CompaniesHouseProfileStore:
+    """Return the loaded profile store shared by all config entries."""
+    return await _async_get_store(hass, DATA_STORE, CompaniesHouseProfileStore)
+
+
+async def async_get_filing_store(hass: HomeAssistant) -> CompaniesHouseFilingStore:
+    """Return the loaded filing store shared by all config entries."""
+    return await _async_get_store(hass, DATA_FILING_STORE, CompaniesHouseFilingStore)
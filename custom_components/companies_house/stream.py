@@ -0,0 +1,192 @@
+"""Consumer of the Companies House streaming API."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import _LOGGER, DATA_STREAMS, DOMAIN, STREAM_URL
+
+if TYPE_CHECKING:
+    from .coordinator import CompaniesHouseDataUpdateCoordinator
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# the stream sends a heartbeat every 30 seconds
+READ_TIMEOUT = 90
+MIN_RECONNECT_DELAY = 1
+MAX_RECONNECT_DELAY = 300
+
+
+class CompaniesHouseStreamConsumer:
+    """Keeps one streaming connection open and pushes profile changes.
+
+    Every event carries a timepoint, the last one seen is stored so a new
+    connection resumes where the previous one stopped.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, stream_key: str, url: str = STREAM_URL
+    ) -> None:
+        """Create a consumer (call async_load before starting it)."""
+        self.hass = hass
+        self._stream_key = stream_key
+        self._url = url
+        self._session = async_get_clientsession(hass)
+        # the key itself is a secret, only a digest is written to disk
+        key_id = hashlib.sha256(stream_key.encode()).hexdigest()[:16]
+        self._store: Store[dict[str, int]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.stream_{key_id}"
+        )
+        self._timepoint: int | None = None
+        # company number -> coordinator receiving its updates
+        self._coordinators: dict[str, CompaniesHouseDataUpdateCoordinator] = {}
+        self._task: asyncio.Task | None = None
+        # doubled after every failed connection, reset once connected
+        self._reconnect_delay = MIN_RECONNECT_DELAY
+
+    @property
+    def timepoint(self) -> int | None:
+        """Return the timepoint of the last event received."""
+        return self._timepoint
+
+    @property
+    def company_numbers(self) -> list[str]:
+        """Return the company numbers followed on the stream."""
+        return list(self._coordinators)
+
+    async def async_load(self) -> None:
+        """Load the stored timepoint."""
+        if (stored := await self._store.async_load()) is not None:
+            self._timepoint = stored.get("timepoint")
+
+    @callback
+    def async_track(
+        self, company_number: str, coordinator: CompaniesHouseDataUpdateCoordinator
+    ) -> None:
+        """Push the changes of a company to its coordinator."""
+        self._coordinators[company_number] = coordinator
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} stream"
+            )
+
+    @callback
+    def async_untrack(self, company_number: str) -> None:
+        """Stop following a company."""
+        self._coordinators.pop(company_number, None)
+
+    async def async_stop(self) -> None:
+        """Close the connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _async_run(self) -> None:
+        while True:
+            try:
+                await self._async_consume()
+            except aiohttp.ClientResponseError as err:
+                if err.status == 401:
+                    _LOGGER.error(
+                        "Companies House stream: Unauthorized (Check Stream Key)"
+                    )
+                    return
+                if err.status == 416:
+                    # the stored timepoint is too old, start from now
+                    _LOGGER.warning("Companies House stream: Timepoint out of range")
+                    self._timepoint = None
+                else:
+                    _LOGGER.warning("Companies House stream: HTTP error %s", err.status)
+            except (aiohttp.ClientError, TimeoutError) as err:
+                _LOGGER.debug("Companies House stream disconnected: %s", err)
+            except Exception:
+                # keep following the companies, whatever went wrong
+                _LOGGER.exception("Unexpected error in Companies House stream")
+            else:
+                # the server closed a healthy connection, reconnect right away
+                continue
+
+            await asyncio.sleep(self._reconnect_delay)
+            self._reconnect_delay = min(self._reconnect_delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _async_consume(self) -> None:
+        params = {}
+        if (timepoint := self.timepoint) is not None:
+            params["timepoint"] = str(timepoint)
+
+        async with self._session.get(
+            self._url,
+            params=params,
+            auth=aiohttp.BasicAuth(self._stream_key, ""),
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=READ_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            _LOGGER.debug("Companies House stream connected at %s", timepoint)
+            # a connection failing hours later starts its backoff over
+            self._reconnect_delay = MIN_RECONNECT_DELAY
+            async for line in response.content:
+                if line.strip():
+                    self._async_handle_event(line)
+
+    @callback
+    def _async_handle_event(self, line: bytes) -> None:
+        try:
+            event: dict[str, Any] = json.loads(line)
+        except ValueError:
+            _LOGGER.debug("Companies House stream: Invalid event %s", line[:100])
+            return
+
+        if (timepoint := event.get("event", {}).get("timepoint")) is not None:
+            self._timepoint = timepoint
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+        if event.get("resource_kind") != "company-profile":
+            return
+        company_number = str(event.get("resource_id", "")).upper()
+        if (coordinator := self._coordinators.get(company_number)) is None:
+            return
+        if event.get("event", {}).get("type") == "deleted":
+            return
+        coordinator.async_push_profiles({company_number: event["data"]}, merge=False)
+
+    @callback
+    def _data_to_save(self) -> dict[str, int]:
+        return {"timepoint": self._timepoint} if self._timepoint is not None else {}
+
+
+async def async_get_stream_consumer(
+    hass: HomeAssistant, stream_key: str
+) -> CompaniesHouseStreamConsumer:
+    """Return the consumer shared by all config entries of a stream key."""
+    consumers: dict[str, CompaniesHouseStreamConsumer] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_STREAMS, {})
+    if (consumer := consumers.get(stream_key)) is None:
+        consumer = CompaniesHouseStreamConsumer(hass, stream_key)
+        await consumer.async_load()
+        # another entry may have created it while the timepoint was loading
+        consumer = consumers.setdefault(stream_key, consumer)
+    return consumer
+
+
+async def async_release_stream_consumer(hass: HomeAssistant, stream_key: str) -> None:
+    """Close the stream of a key once no company follows it."""
+    consumers: dict[str, CompaniesHouseStreamConsumer] = hass.data[DOMAIN][DATA_STREAMS]
+    consumer = consumers.get(stream_key)
+    if consumer is not None and not consumer.company_numbers:
+        del consumers[stream_key]
+        await consumer.async_stop()
@@ -0,0 +1,307 @@
+"""Transports of the API client: HTTP, and recording to or replaying an archive.
+
+An archive is a gzipped file with one JSON line per response:
+[request, status, headers, body].
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+import gzip
+import json
+from pathlib import Path
+import random
+from typing import Any
+from urllib.parse import urlencode
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    _LOGGER,
+    API_BASE_URL,
+    CONF_ERROR_RATE,
+    CONF_ERROR_STATUS,
+    CONF_LATENCY,
+    CONF_MODE,
+    CONF_PATH,
+    DATA_TRANSPORT,
+    DOMAIN,
+)
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# response headers worth keeping, the rate limit is left to the local bucket
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+SAVE_DELAY = 30
+
+
+@dataclass(frozen=True, slots=True)
+class TransportResponse:
+    """Status, headers and body of a response."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes = b""
+
+
+def request_key(path: str, params: Mapping[str, str] | None) -> str:
+    """Return the key of a request in an archive."""
+    if not params:
+        return path
+    return f"{path}?{urlencode(sorted(params.items()))}"
+
+
+class CompaniesHouseTransport(ABC):
+    """Sends the requests of the API client."""
+
+    @abstractmethod
+    async def async_get(
+        self,
+        path: str,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+        api_key: str,
+    ) -> TransportResponse:
+        """Send a GET request and return its response."""
+
+
+class CompaniesHouseHttpTransport(CompaniesHouseTransport):
+    """Sends the requests of the API client over HTTP."""
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str) -> None:
+        """Create a transport to an API server."""
+        self._session = session
+        self._base_url = base_url
+
+    async def async_get(
+        self,
+        path: str,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+        api_key: str,
+    ) -> TransportResponse:
+        """Send a GET request and return its response."""
+        async with self._session.get(
+            f"{self._base_url}{path}",
+            params=params,
+            headers=headers,
+            auth=aiohttp.BasicAuth(api_key, ""),
+        ) as response:
+            body = await response.read()
+            return TransportResponse(response.status, response.headers, body)
+
+
+def _read_archive(path: Path) -> dict[str, list[TransportResponse]]:
+    """Return the responses of an archive by request, in recorded order."""
+    responses: dict[str, list[TransportResponse]] = {}
+    if not path.exists():
+        return responses
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        for line in archive:
+            key, status, headers, body = json.loads(line)
+            responses.setdefault(key, []).append(
+                TransportResponse(status, headers, body.encode())
+            )
+    return responses
+
+
+def _write_archive(path: Path, responses: dict[str, list[TransportResponse]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    with gzip.open(temp_path, "wt", encoding="utf-8") as archive:
+        for key, recorded in responses.items():
+            for response in recorded:
+                archive.write(
+                    json.dumps(
+                        [
+                            key,
+                            response.status,
+                            dict(response.headers),
+                            response.body.decode(),
+                        ],
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                )
+    temp_path.replace(path)
+
+
+class CompaniesHouseRecordingTransport(CompaniesHouseTransport):
+    """Sends requests over HTTP and records their responses to an archive.
+
+    A response equal to the last one of the same request is not recorded
+    again, so the archive only grows when the API answers differently.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        transport: CompaniesHouseHttpTransport,
+        path: Path,
+    ) -> None:
+        """Create a transport (call async_load before use)."""
+        self._hass = hass
+        self._transport = transport
+        self._path = path
+        self._responses: dict[str, list[TransportResponse]] = {}
+        self._cancel_save: Any = None
+
+    async def async_load(self) -> None:
+        """Keep the responses recorded so far, and save them before stopping."""
+        self._responses = await self._hass.async_add_executor_job(
+            _read_archive, self._path
+        )
+        self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+
+    async def async_get(
+        self,
+        path: str,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+        api_key: str,
+    ) -> TransportResponse:
+        """Send a GET request and record its response."""
+        response = await self._transport.async_get(path, params, headers, api_key)
+        # a 304 has no body to replay, the full response was recorded before
+        if response.status != 304:
+            recorded = TransportResponse(
+                response.status,
+                {
+                    name: value
+                    for name in RECORDED_HEADERS
+                    if (value := response.headers.get(name)) is not None
+                },
+                response.body,
+            )
+            responses = self._responses.setdefault(request_key(path, params), [])
+            if not responses or responses[-1] != recorded:
+                responses.append(recorded)
+                self._async_schedule_save()
+        return response
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        if self._cancel_save is None:
+            self._cancel_save = async_call_later(
+                self._hass, SAVE_DELAY, self._async_save
+            )
+
+    async def _async_save(self, *_: Any) -> None:
+        self._cancel_save = None
+        # the executor writes a snapshot, recording goes on meanwhile
+        snapshot = {key: list(responses) for key, responses in self._responses.items()}
+        await self._hass.async_add_executor_job(_write_archive, self._path, snapshot)
+
+    async def _async_final_write(self, _: Event) -> None:
+        if self._cancel_save is not None:
+            self._cancel_save()
+            await self._async_save()
+
+
+@dataclass(slots=True)
+class _Replayed:
+    """Responses of a request and the next one to serve."""
+
+    responses: list[TransportResponse]
+    index: int = 0
+
+
+class CompaniesHouseReplayTransport(CompaniesHouseTransport):
+    """Serves the responses of an archive, without network access.
+
+    The responses recorded for a request are served in order, the last one
+    repeatedly. Conditional requests are answered 304 when the ETag matches.
+    Every response can be delayed, and a share of them replaced by errors.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: Path,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+    ) -> None:
+        """Create a transport (call async_load before use)."""
+        self._hass = hass
+        self._path = path
+        self._latency = latency
+        self._error_rate = error_rate
+        # 0 fails the connection instead of answering
+        self._error_status = error_status
+        self._requests: dict[str, _Replayed] = {}
+
+    async def async_load(self) -> None:
+        """Read the archive."""
+        if not self._path.exists():
+            _LOGGER.warning("Replay archive %s not found", self._path)
+        responses = await self._hass.async_add_executor_job(_read_archive, self._path)
+        self._requests = {
+            key: _Replayed(recorded) for key, recorded in responses.items()
+        }
+
+    async def async_get(
+        self,
+        path: str,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+        api_key: str,
+    ) -> TransportResponse:
+        """Return the recorded response of a request."""
+        if self._latency:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * self._latency)
+        if self._error_rate and random.random() < self._error_rate:
+            if not self._error_status:
+                raise aiohttp.ClientConnectionError("Injected connection error")
+            return TransportResponse(self._error_status, {})
+
+        if (replayed := self._requests.get(request_key(path, params))) is None:
+            return TransportResponse(404, {})
+        response = replayed.responses[replayed.index]
+        replayed.index = min(replayed.index + 1, len(replayed.responses) - 1)
+
+        etag = response.headers.get("ETag")
+        if etag is not None and headers and headers.get("If-None-Match") == etag:
+            return TransportResponse(304, {"ETag": etag})
+        return response
+
+
+async def async_setup_transport(hass: HomeAssistant, config: Mapping[str, Any]) -> None:
+    """Use a recording or replaying transport for every API client."""
+    path = Path(hass.config.path(config[CONF_PATH]))
+    transport: CompaniesHouseRecordingTransport | CompaniesHouseReplayTransport
+    if config[CONF_MODE] == MODE_RECORD:
+        transport = CompaniesHouseRecordingTransport(
+            hass,
+            CompaniesHouseHttpTransport(async_get_clientsession(hass), API_BASE_URL),
+            path,
+        )
+    else:
+        transport = CompaniesHouseReplayTransport(
+            hass,
+            path,
+            config[CONF_LATENCY],
+            config[CONF_ERROR_RATE],
+            config[CONF_ERROR_STATUS],
+        )
+    await transport.async_load()
+    _LOGGER.warning("Companies House API responses: %s %s", config[CONF_MODE], path)
+    hass.data.setdefault(DOMAIN, {})[DATA_TRANSPORT] = transport
+
+
+def async_get_transport(hass: HomeAssistant, base_url: str) -> CompaniesHouseTransport:
+    """Return the transport configured for the API clients, else HTTP to a URL."""
+    if (transport := hass.data.get(DOMAIN, {}).get(DATA_TRANSPORT)) is not None:
+        return transport
+    return CompaniesHouseHttpTransport(async_get_clientsession(hass), base_url)
@@ -0,0 +1,86 @@
+"""Tests of the Company data product snapshot reader."""
+
+from pathlib import Path
+import zipfile
+
+import pytest
+
+from custom_components.companies_house.snapshot import (
+    CompaniesHouseSnapshotSource,
+    SnapshotFormatError,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "company_data_snapshot.csv"
+TRACKED = {"01234567", "SC123456", "00000001"}
+
+
+def test_read_profiles() -> None:
+    """Rows of tracked companies are mapped to the shape of the API."""
+    profiles = CompaniesHouseSnapshotSource(FIXTURE).read_profiles(TRACKED)
+
+    assert set(profiles) == {"01234567", "SC123456"}
+    assert profiles["01234567"] == {
+        "company_number": "01234567",
+        "company_name": "EXAMPLE TRADING LIMITED",
+        "company_status": "active",
+        "type": "ltd",
+        "jurisdiction": "england-wales",
+        "date_of_creation": "2010-02-01",
+        "registered_office_address": {
+            "address_line_1": "1 HIGH STREET",
+            "locality": "LONDON",
+            "postal_code": "EC1A 1AA",
+            "country": "UNITED KINGDOM",
+        },
+        "sic_codes": ["62012"],
+        "accounts": {
+            "next_accounts": {"due_on": "2026-09-30"},
+            "last_accounts": {
+                "made_up_to": "2024-12-31",
+                "period_end_on": "2024-12-31",
+                "type": "total-exemption-full",
+            },
+        },
+        "confirmation_statement": {
+            "next_due": "2027-02-15",
+            "last_made_up_to": "2026-02-01",
+        },
+    }
+
+    scottish = profiles["SC123456"]
+    assert scottish["company_name"] == "HIGHLAND HOLDINGS, PLC"
+    assert scottish["company_status"] == "active"
+    assert scottish["type"] == "plc"
+    assert scottish["jurisdiction"] == "scotland"
+    assert scottish["sic_codes"] == ["64209", "70100"]
+    assert "type" not in scottish["accounts"]["last_accounts"]
+
+
+def test_read_profiles_from_zip(tmp_path: Path) -> None:
+    """The CSV is read from the zip archive it is published as."""
+    path = tmp_path / "BasicCompanyDataAsOneFile.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.write(FIXTURE, "BasicCompanyDataAsOneFile.csv")
+
+    assert CompaniesHouseSnapshotSource(path).read_profiles(
+        TRACKED
+    ) == CompaniesHouseSnapshotSource(FIXTURE).read_profiles(TRACKED)
+
+
+def test_missing_company_number_column(tmp_path: Path) -> None:
+    """A CSV without the CompanyNumber column is rejected."""
+    path = tmp_path / "other.csv"
+    path.write_text("Name,Number\nEXAMPLE,01234567\n", encoding="utf-8")
+
+    with pytest.raises(SnapshotFormatError):
+        CompaniesHouseSnapshotSource(path).read_profiles(TRACKED)
+
+
+def test_zip_without_csv(tmp_path: Path) -> None:
+    """A zip archive without a CSV file is rejected."""
+    path = tmp_path / "other.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("readme.txt", "no data")
+
+    with pytest.raises(SnapshotFormatError):
+        CompaniesHouseSnapshotSource(path).read_profiles(TRACKED)
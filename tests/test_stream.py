@@ -0,0 +1,81 @@
+"""Tests of the streaming API consumer against a local server."""
+
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.companies_house import stream
+from custom_components.companies_house.stream import CompaniesHouseStreamConsumer
+
+COMPANY_NUMBER = "01234567"
+
+
+def _event(timepoint: int, company_name: str) -> bytes:
+    return (
+        json.dumps(
+            {
+                "resource_kind": "company-profile",
+                "resource_id": COMPANY_NUMBER,
+                "data": {"company_name": company_name},
+                "event": {"timepoint": timepoint, "type": "changed"},
+            }
+        ).encode()
+        + b"\n"
+    )
+
+
+async def test_reconnects_and_resumes(hass: HomeAssistant, aiohttp_server) -> None:
+    """A dropped stream reconnects with backoff from the last timepoint."""
+    timepoints: list[str | None] = []
+    connected = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        timepoints.append(request.query.get("timepoint"))
+        if len(timepoints) == 2:
+            # a failed connection is retried after the backoff delay
+            return web.Response(status=503)
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b"\n")
+        await response.write(_event(len(timepoints), f"NAME {len(timepoints)}"))
+        if len(timepoints) == 3:
+            connected.set()
+            await release.wait()
+        # the first connection is closed cleanly
+        return response
+
+    app = web.Application()
+    app.router.add_get("/companies", handler)
+    server = await aiohttp_server(app)
+
+    coordinator = Mock()
+    with (
+        patch.object(stream, "MIN_RECONNECT_DELAY", 0.01),
+        patch.object(stream, "MAX_RECONNECT_DELAY", 0.02),
+    ):
+        consumer = CompaniesHouseStreamConsumer(
+            hass, "stream-key", str(server.make_url("/companies"))
+        )
+        await consumer.async_load()
+        consumer.async_track(COMPANY_NUMBER, coordinator)
+        await asyncio.wait_for(connected.wait(), 5)
+        await asyncio.sleep(0.05)
+
+        assert timepoints == [None, "1", "1"]
+        assert consumer.timepoint == 3
+        # the backoff starts over once a connection is established
+        assert consumer._reconnect_delay == 0.01  # noqa: SLF001
+        assert [
+            call.args for call in coordinator.async_push_profiles.call_args_list
+        ] == [
+            ({COMPANY_NUMBER: {"company_name": "NAME 1"}},),
+            ({COMPANY_NUMBER: {"company_name": "NAME 3"}},),
+        ]
+
+        release.set()
+        await consumer.async_stop()